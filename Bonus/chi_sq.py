@@ -458,6 +458,84 @@ def Gamma3(z: float) -> float:
 # ``Gamma2()`` function, shown above. The number of terms required seems
 # to vary with the range of the vaue of :math:`z`.
 
+# Gamma Function 4
+# -------------------
+
+# Here's the Lanczos approximation. Unlike the previous versions, this is
+# accurate to almost the full precision of a float for all positive
+# real arguments, not just the integer and half-integer values.
+#
+# ..  math::
+#
+#     \Gamma(z+1) \approx \sqrt{2\pi} \left(z+g+\tfrac{1}{2}\right)^{z+\frac{1}{2}} e^{-\left(z+g+\frac{1}{2}\right)} A_g(z)
+#
+# where
+#
+# ..  math::
+#
+#     A_g(z) = p_0 + \sum_{k=1}^{N-1} \dfrac{p_k}{z+k}
+#
+# We'll use the widely-published coefficients for :math:`g=7` and :math:`N=9`.
+
+lanczos_g = 7
+lanczos_p = [
+    0.99999999999980993, 676.5203681218851, -1259.1392167224028,
+    771.32342877765313, -176.61502916214059, 12.507343278686905,
+    -0.13857109526572012, 9.9843695780195716e-6, 1.5056327351493116e-7
+]
+
+# We'll compute :math:`\ln \Gamma(z)` first. Working with the logarithm
+# avoids overflow: :math:`\Gamma(172)` is too large for a float,
+# but :math:`\ln \Gamma(172)` is only about 711.
+#
+# For :math:`z < \frac{1}{2}`, the reflection formula,
+# :math:`\Gamma(z)\Gamma(1-z) = \dfrac{\pi}{\sin \pi z}`,
+# moves the argument into the range where the approximation is accurate.
+
+def log_Gamma_Lanczos(z: float) -> float:
+    """ln Gamma(z) for z > 0. Lanczos version.
+
+    >>> import math
+    >>> round(log_Gamma_Lanczos(.5), 7)
+    0.5723649
+    >>> round(math.log(math.sqrt(math.pi)), 7)
+    0.5723649
+    >>> abs(log_Gamma_Lanczos(1000) - math.lgamma(1000)) < 1E-10
+    True
+    """
+    if z <= 0:
+        raise ValueError(f"log_Gamma_Lanczos({z}) requires z > 0")
+    if z < .5:
+        return math.log(math.pi/math.sin(math.pi*z)) - log_Gamma_Lanczos(1-z)
+    z -= 1
+    a = lanczos_p[0] + sum(
+        p_k/(z+k) for k, p_k in enumerate(lanczos_p[1:], start=1)
+    )
+    t = z + lanczos_g + .5
+    return .5*math.log(2*math.pi) + (z+.5)*math.log(t) - t + math.log(a)
+
+def Gamma_Lanczos(z: float) -> float:
+    """Gamma Function for z > 0. Lanczos version.
+
+    Gamma(n) == fact(n-1)
+
+    >>> import math
+    >>> round(Gamma_Lanczos(5), 9)
+    24.0
+    >>> round(Gamma_Lanczos(.5), 7)
+    1.7724539
+    >>> round(math.sqrt(math.pi), 7)
+    1.7724539
+    >>> round(Gamma_Lanczos(2.25), 7)
+    1.1330031
+    >>> round(math.gamma(2.25), 7)
+    1.1330031
+    """
+    return math.exp(log_Gamma_Lanczos(z))
+
+# The exponential limits :math:`\Gamma(z)` to :math:`z < 171.6`, the same
+# limit as ``math.gamma()``. Larger values must stay in log space.
+
 # Gamma Hybrid
 # -------------
 
@@ -537,6 +615,75 @@ test_math_gamma = """
 # This looks good, also. For the given test cases, it's as accurate
 # as our hybrid shown above.
 
+# Accuracy and Performance
+# -------------------------
+
+# We can compare all of these Gamma functions with the ``math`` module.
+# First, the Lanczos version over a wide range of arguments.
+# We'll measure the absolute error of :math:`\ln \Gamma(z)`,
+# and the relative error of :math:`\Gamma(z)`.
+
+def accuracy_report() -> None:
+    """Errors of the Lanczos version compared with math.lgamma()."""
+    print(f"{'range':>16s} {'max abs ln error':>17s} {'max rel error':>14s}")
+    for low, high in (.01, .5), (.5, 10), (10, 100), (100, 170), (170, 10000):
+        z_values = [low + (high-low)*i/1000 for i in range(1, 1001)]
+        log_error = max(
+            abs(log_Gamma_Lanczos(z) - math.lgamma(z)) for z in z_values
+        )
+        rel_error = max(
+            abs(Gamma_Lanczos(z)/math.gamma(z) - 1) if z < 171 else math.nan
+            for z in z_values
+        )
+        print(f"{low:7.2f}..{high:<7.2f} {log_error:17.2e} {rel_error:14.2e}")
+
+# Then, all of the variants for the :math:`\Gamma\left(\frac{k}{2}\right)`
+# values a :math:`\chi^2` test needs, plus some values in between.
+# The ``Gamma1f()`` version is very slow, so it does fewer repetitions.
+
+def relative_error(function: Callable[[float], float], z: float) -> float:
+    """Relative error compared with math.gamma(); inf if the function fails."""
+    try:
+        return abs(float(function(z))/math.gamma(z) - 1)
+    except (ArithmeticError, TypeError, ValueError):
+        return math.inf
+
+def benchmark() -> None:
+    """Speed and maximum relative error of each Gamma variant."""
+    import timeit
+    variants: list[Tuple[str, Callable[[float], float], int]] = [
+        ("Gamma1", Gamma1, 10),
+        ("Gamma1f", Gamma1f, 1),
+        ("Gamma2", Gamma2, 1000),
+        ("Gamma3", Gamma3, 1000),
+        ("Gamma_Half", Gamma_Half, 1000),
+        ("Gamma_Lanczos", Gamma_Lanczos, 1000),
+        ("math.gamma", math.gamma, 1000),
+    ]
+    half_k = [k/2 for k in range(1, 31)]
+    between = [k/2 + .2 for k in range(1, 31)]
+    print(f"{'function':>14s} {'µs/call':>10s} {'k/2 error':>10s} {'other error':>12s}")
+    for name, function, number in variants:
+        working = [z for z in half_k if relative_error(function, z) < math.inf]
+        seconds = timeit.timeit(
+            lambda: [function(z) for z in working], number=number
+        )
+        half_error = max(relative_error(function, z) for z in half_k)
+        other_error = max(relative_error(function, z) for z in between)
+        print(
+            f"{name:>14s} {1E6*seconds/(number*len(working)):10.2f} "
+            f"{half_error:10.1e} {other_error:12.1e}"
+        )
+
+# An error of ``inf`` means the function fails for some of the arguments.
+# ``Gamma1()``, for example, has no terms to multiply when :math:`t=1`.
+#
+# Of these, only the Lanczos version is accurate for all arguments:
+# the relative error is near :math:`10^{-15}` for small arguments, and
+# grows slowly to near :math:`10^{-13}` as :math:`z` approaches 171.
+# ``Gamma_Half()`` is exact for half-integers, but uses
+# ``Gamma2()`` everywhere else, including the integers.
+
 # Cumulative Distribution Function
 # ==================================
 
@@ -601,3 +748,5 @@ def test(*args, **kw):
 
 if __name__ == "__main__":
     test()
+    accuracy_report()
+    benchmark()
@@ -58,6 +58,149 @@ def test_join() -> None:
     assert m == "hello world"
 
 
+from collections import defaultdict
+from collections.abc import Hashable
+from itertools import groupby
+from typing import Any, Protocol
+
+JK = TypeVar("JK", bound=Hashable)
+
+
+def hash_join(
+    t1: Iterable[JTL],
+    t2: Iterable[JTR],
+    left_key: Callable[[JTL], JK],
+    right_key: Callable[[JTR], JK],
+) -> Iterable[tuple[JTL, JTR]]:
+    """
+    Equi-join: ``t2`` is loaded into a dict by key; ``t1`` is streamed.
+    The pairs are in the same order as ``join()`` produces.
+    """
+    table: defaultdict[JK, list[JTR]] = defaultdict(list)
+    for right in t2:
+        table[right_key(right)].append(right)
+    for left in t1:
+        for right in table.get(left_key(left), []):
+            yield left, right
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any, /) -> bool:
+        ...
+
+
+CK = TypeVar("CK", bound=Comparable)
+
+
+def merge_join(
+    t1: Iterable[JTL],
+    t2: Iterable[JTR],
+    left_key: Callable[[JTL], CK],
+    right_key: Callable[[JTR], CK],
+) -> Iterable[tuple[JTL, JTR]]:
+    """
+    Equi-join of two inputs already sorted by their keys.
+    Only one group of equal-keyed rows from ``t2`` is in memory at a time.
+    """
+    left_groups = groupby(t1, key=left_key)
+    right_groups = groupby(t2, key=right_key)
+    left_group = next(left_groups, None)
+    right_group = next(right_groups, None)
+    while left_group is not None and right_group is not None:
+        (l_key, lefts), (r_key, rights) = left_group, right_group
+        if l_key < r_key:
+            left_group = next(left_groups, None)
+        elif r_key < l_key:
+            right_group = next(right_groups, None)
+        else:
+            matches = list(rights)
+            for left in lefts:
+                for right in matches:
+                    yield left, right
+            left_group = next(left_groups, None)
+            right_group = next(right_groups, None)
+
+
+import pickle
+import tempfile
+from pathlib import Path
+
+
+PT = TypeVar("PT")
+
+
+def partition(
+    rows: Iterable[PT], key: Callable[[PT], Hashable], directory: Path, partitions: int
+) -> list[Path]:
+    """Spills rows to ``partitions`` files, chosen by the hash of the key."""
+    paths = [directory / f"{n}.pickle" for n in range(partitions)]
+    files = [path.open("wb") for path in paths]
+    try:
+        for row in rows:
+            pickle.dump(row, files[hash(key(row)) % partitions])
+    finally:
+        for file in files:
+            file.close()
+    return paths
+
+
+def unpickle_iter(path: Path) -> Iterator[Any]:
+    with path.open("rb") as source:
+        while True:
+            try:
+                yield pickle.load(source)
+            except EOFError:
+                return
+
+
+def grace_hash_join(
+    t1: Iterable[JTL],
+    t2: Iterable[JTR],
+    left_key: Callable[[JTL], JK],
+    right_key: Callable[[JTR], JK],
+    partitions: int = 16,
+) -> Iterable[tuple[JTL, JTR]]:
+    """
+    Equi-join for inputs too big for memory.
+    Both inputs are spilled to partition files by key hash; matching rows land
+    in matching partitions, and each pair of partitions is hash-joined.
+    Only one partition of ``t2`` is in memory at a time.
+    The pairs are grouped by partition, not in ``join()`` order.
+    """
+    with tempfile.TemporaryDirectory() as temp:
+        left_dir, right_dir = Path(temp) / "left", Path(temp) / "right"
+        left_dir.mkdir()
+        right_dir.mkdir()
+        left_paths = partition(t1, left_key, left_dir, partitions)
+        right_paths = partition(t2, right_key, right_dir, partitions)
+        for left_path, right_path in zip(left_paths, right_paths):
+            yield from hash_join(
+                unpickle_iter(left_path),
+                unpickle_iter(right_path),
+                left_key,
+                right_key,
+            )
+
+
+def test_equi_joins() -> None:
+    t1 = [(1,), (2,), (3,), (3,), (4,), (8,), (5,), (4,), (6,), (3,), (7,)]
+    t2 = [(1, "h"), (2, "e"), (3, "l"), (4, "o"), (5, "w"), (6, "r"), (7, "d")]
+    t2 += [(8, " "), (3, "L")]
+    match = lambda a_b: a_b[0][0] == a_b[1][0]
+    expected = list(join(t1, t2, where=match))
+
+    assert list(hash_join(t1, t2, lambda a: a[0], lambda b: b[0])) == expected
+
+    pairs = merge_join(sorted(t1), sorted(t2), lambda a: a[0], lambda b: b[0])
+    assert sorted(pairs) == sorted(expected)
+
+    pairs = grace_hash_join(t1, t2, lambda a: a[0], lambda b: b[0], partitions=3)
+    assert sorted(pairs) == sorted(expected)
+
+    assert list(hash_join(t1, [], lambda a: a[0], lambda b: b[0])) == []
+    assert list(merge_join([], sorted(t2), lambda a: a[0], lambda b: b[0])) == []
+
+
 from typing import NamedTuple
 
 
@@ -106,8 +249,32 @@ Pixel = tuple[Point, RGB]
 
 
 def pixel_iter(img: Image) -> Iterator[Pixel]:
+    """
+    Pixels in column order, like ``getpixel()`` over ``product(range(w), range(h))``.
+    The transposed image's raw bytes are in that order, avoiding a per-pixel call.
+    """
+    w, h = img.size
+    columns = img.convert("RGB").transpose(Image.Transpose.TRANSPOSE).tobytes()
+    bands = iter(columns)
+    return zip(product(range(w), range(h)), zip(bands, bands, bands))
+
+
+def pixels_image(pixels: Iterable[Pixel], size: tuple[int, int]) -> Image:
+    """Writes ``(Point, RGB)`` pixels into a buffer, then makes the image in bulk."""
+    w, h = size
+    raw = bytearray(w * h * 3)
+    for (x, y), (r, g, b) in pixels:
+        offset = 3 * (y * w + x)
+        raw[offset : offset + 3] = bytes((r, g, b))
+    return Image.frombytes("RGB", size, bytes(raw))
+
+
+def test_pixel_iter() -> None:
+    img = Image.open("IMG_2705.jpg").crop((0, 0, 24, 16))
     w, h = img.size
-    return ((c, img.getpixel(c)) for c in product(range(w), range(h)))
+    expected = [(c, img.getpixel(c)) for c in product(range(w), range(h))]
+    assert list(pixel_iter(img)) == expected
+    assert pixels_image(pixel_iter(img), img.size).tobytes() == img.tobytes()
 
 
 REPL_pixel_iter = """
@@ -320,6 +487,297 @@ Note that the name of the string doesn't start with REPL to avoid running it as
 >>> revised[:10]
 """
 
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any
+
+
+def euclidean_block(
+    pixels: NDArray[np.int32], palette: NDArray[np.int32]
+) -> NDArray[np.float64]:
+    """
+    |c|**2 - 2 p.c, from one matrix product; adding |p|**2 gives |p - c|**2.
+    The values are integers well under 2**53, so float64 is exact.
+    """
+    c = palette.astype(np.float64)
+    scores: NDArray[np.float64] = (c * c).sum(axis=1) - 2 * (
+        pixels.astype(np.float64) @ c.T
+    )
+    return scores
+
+
+def euclidean_finish(
+    pixels: NDArray[np.int32], scores: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    p = pixels.astype(np.float64)
+    distances: NDArray[np.float64] = np.sqrt((p * p).sum(axis=1) + scores)
+    return distances
+
+
+def manhattan_block(
+    pixels: NDArray[np.int32], palette: NDArray[np.int32]
+) -> NDArray[np.float64]:
+    differences = sum(
+        np.abs(pixels[:, None, band] - palette[None, :, band]) for band in range(3)
+    )
+    distances: NDArray[np.float64] = np.asarray(differences, dtype=np.float64)
+    return distances
+
+
+def max_d_block(
+    pixels: NDArray[np.int32], palette: NDArray[np.int32]
+) -> NDArray[np.float64]:
+    differences = np.maximum.reduce(
+        [np.abs(pixels[:, None, band] - palette[None, :, band]) for band in range(3)]
+    )
+    distances: NDArray[np.float64] = differences.astype(np.float64)
+    return distances
+
+
+def as_distance(
+    pixels: NDArray[np.int32], scores: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    return scores
+
+
+BlockScore = Callable[[NDArray[np.int32], NDArray[np.int32]], NDArray[np.float64]]
+BlockFinish = Callable[[NDArray[np.int32], NDArray[np.float64]], NDArray[np.float64]]
+
+BLOCK_DISTANCE: dict[Callable[[RGB, Color], float], tuple[BlockScore, BlockFinish]] = {
+    euclidean: (euclidean_block, euclidean_finish),
+    manhattan: (manhattan_block, as_distance),
+    max_d: (max_d_block, as_distance),
+}
+"""
+For each metric, a (pixels, palette) score with the same ordering as the
+distance, and a function to compute distances from the best scores.
+"""
+
+
+def image_array(img: Image) -> NDArray[np.uint8]:
+    """The image as an (H, W, 3) array of RGB values."""
+    return np.asarray(img.convert("RGB"))
+
+
+def palette_array(colors: Sequence[Color]) -> NDArray[np.int32]:
+    """The palette as a (K, 3) array of RGB values."""
+    return np.array([c.rgb for c in colors], dtype=np.int32)
+
+
+def pack_rgb(pixels: NDArray[np.integer[Any]]) -> NDArray[np.int32]:
+    """(..., 3) RGB values packed into 24-bit integers."""
+    rgb = pixels.astype(np.int32)
+    packed: NDArray[np.int32] = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+    return packed
+
+
+def nearest_rgb(
+    rgb: NDArray[np.int32],
+    palette: NDArray[np.int32],
+    distance: Callable[[RGB, Color], float] = euclidean,
+    block_size: int = 16384,
+) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+    """
+    Index of the nearest palette color, and its distance, for each row
+    of an (N, 3) array. Rows are matched ``block_size`` at a time to bound
+    the temporary (block_size, K) distance array.
+    Ties go to the earliest color, the same choice ``min()`` makes.
+    """
+    block_score, finish = BLOCK_DISTANCE[distance]
+    indices = np.empty(len(rgb), dtype=np.intp)
+    best = np.empty(len(rgb), dtype=np.float64)
+    for start in range(0, len(rgb), block_size):
+        pixels = rgb[start : start + block_size]
+        scores = block_score(pixels, palette)
+        choice = scores.argmin(axis=1)
+        indices[start : start + block_size] = choice
+        best[start : start + block_size] = finish(
+            pixels, scores[np.arange(len(choice)), choice]
+        )
+    return indices, best
+
+
+def nearest_palette(
+    pixels: NDArray[np.uint8],
+    colors: Sequence[Color],
+    distance: Callable[[RGB, Color], float] = euclidean,
+    block_size: int = 16384,
+) -> tuple[NDArray[np.intp], NDArray[np.float64]]:
+    """
+    Index of the nearest palette color, and its distance, for each pixel
+    in an (..., 3) array of RGB values.
+    A photo has far fewer distinct colors than pixels, so only the distinct
+    colors are matched.
+    """
+    distinct, inverse = np.unique(pack_rgb(pixels).ravel(), return_inverse=True)
+    rgb = np.stack([distinct >> 16, (distinct >> 8) & 0xFF, distinct & 0xFF], axis=1)
+    indices, best = nearest_rgb(rgb, palette_array(colors), distance, block_size)
+    shape = pixels.shape[:-1]
+    return indices[inverse].reshape(shape), best[inverse].reshape(shape)
+
+
+def matching_3(
+    img: Image,
+    colors: Sequence[Color],
+    distance: Callable[[RGB, Color], float] = euclidean,
+) -> Iterator[tuple[Point, RGB, Color, float]]:
+    """
+    The results of ``matching_2(pixel_iter(img), colors)``,
+    computed for the whole image at once with NumPy.
+    """
+    pixels = image_array(img)
+    indices, best = nearest_palette(pixels, colors, distance)
+    w, h = img.size
+    for x, y in product(range(w), range(h)):
+        r, g, b = pixels[y, x].tolist()
+        yield (x, y), (r, g, b), colors[indices[y, x]], float(best[y, x])
+
+
+def test_matching_3() -> None:
+    img = Image.open("IMG_2705.jpg").crop((0, 0, 24, 16))
+    colors = get_colors()
+    assert list(matching_3(img, colors)) == list(matching_2(pixel_iter(img), colors))
+
+    pixels = image_array(img)
+    for distance in (manhattan, max_d):
+        indices, best = nearest_palette(pixels, colors, distance, block_size=7)
+        for (x, y), rgb in pixel_iter(img):
+            expected = min(colors, key=lambda c: distance(rgb, c))
+            assert colors[indices[y, x]] == expected
+            assert best[y, x] == distance(rgb, expected)
+
+
+import hashlib
+from pathlib import Path
+
+
+class PaletteIndex:
+    """
+    A lookup table from every RGB value to the index of its nearest color.
+
+    With ``bits=8`` there's a cell for each of the 2**24 RGB values,
+    and lookups are exact. With fewer bits, each band is masked to its
+    top ``bits`` bits, e.g., ``bits=5`` is a 2**15-cell table.
+
+    The disk cache is opt-in. With a ``cache_dir``, the table is saved there
+    as a ``.npy`` file (16 MiB for ``bits=8``), and reused by later instances
+    with the same colors, distance, and bits.
+    """
+
+    def __init__(
+        self,
+        colors: Sequence[Color],
+        distance: Callable[[RGB, Color], float] = euclidean,
+        bits: int = 8,
+        cache_dir: Path | None = None,
+    ) -> None:
+        self.colors = list(colors)
+        self.distance = distance
+        self.bits = bits
+        self.shift = 8 - bits
+        self.mask = (0xFF << self.shift) & 0xFF
+        if cache_dir is None:
+            self.table = self._build()
+        else:
+            cache_path = cache_dir / self.cache_name()
+            if cache_path.exists():
+                self.table = np.load(cache_path)
+            else:
+                self.table = self._build()
+                temporary = cache_path.with_suffix(".tmp.npy")
+                np.save(temporary, self.table)
+                temporary.replace(cache_path)
+        self._cells = self.table.data
+
+    def __getstate__(self) -> dict[str, Any]:
+        """A memoryview can't be pickled; it's rebuilt from the table."""
+        state = self.__dict__.copy()
+        del state["_cells"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cells = self.table.data
+
+    def cache_name(self) -> str:
+        key = repr((self.colors, self.distance.__name__, self.bits))
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return f"palette_{digest[:16]}.npy"
+
+    def _build(self) -> NDArray[np.unsignedinteger[Any]]:
+        levels = np.arange(0, 256, 1 << self.shift, dtype=np.int32)
+        palette = palette_array(self.colors)
+        distance = self.distance
+        g, b = np.meshgrid(levels, levels, indexing="ij")
+        gb = np.column_stack([g.ravel(), b.ravel()])
+        # One red level at a time keeps the working arrays small.
+        planes = (
+            nearest_rgb(np.column_stack([np.full(len(gb), r), gb]), palette, distance)
+            for r in levels
+        )
+        dtype = np.uint8 if len(self.colors) <= 256 else np.uint16
+        return np.concatenate([indices for indices, _ in planes]).astype(dtype)
+
+    def key(self, rgb: RGB) -> int:
+        r, g, b = rgb
+        s, n = self.shift, self.bits
+        return ((r >> s) << 2 * n) | ((g >> s) << n) | (b >> s)
+
+    def __getitem__(self, rgb: RGB) -> Color:
+        return self.colors[self._cells[self.key(rgb)]]
+
+    def lookup_array(
+        self, pixels: NDArray[np.uint8]
+    ) -> NDArray[np.unsignedinteger[Any]]:
+        """Palette indices for an (..., 3) array of RGB values."""
+        bands = pixels.astype(np.int32) >> self.shift
+        n = self.bits
+        keys = (bands[..., 0] << 2 * n) | (bands[..., 1] << n) | bands[..., 2]
+        indices: NDArray[np.unsignedinteger[Any]] = self.table[keys]
+        return indices
+
+
+def matching_4(
+    pixels: Iterable[Pixel], index: PaletteIndex
+) -> Iterator[tuple[Point, RGB, Color, float]]:
+    """``matching_2()`` with an O(1) table lookup replacing the palette scan."""
+    for xy, pixel in pixels:
+        color = index[pixel]
+        yield xy, pixel, color, index.distance(pixel, color)
+
+
+def test_palette_index(tmp_path: Path) -> None:
+    img = Image.open("IMG_2705.jpg").crop((0, 0, 24, 16))
+    colors = get_colors()[::19]
+    index = PaletteIndex(colors, bits=8, cache_dir=tmp_path)
+    assert len(index.table) == 2**24
+    assert list(matching_4(pixel_iter(img), index)) == list(
+        matching_2(pixel_iter(img), colors)
+    )
+    indices, _ = nearest_palette(image_array(img), colors)
+    assert (index.lookup_array(image_array(img)) == indices).all()
+
+    cached = PaletteIndex(colors, bits=8, cache_dir=tmp_path)
+    assert list(tmp_path.glob("*.npy")) == [tmp_path / index.cache_name()]
+    assert (cached.table == index.table).all()
+
+    small = PaletteIndex(colors, distance=manhattan, bits=5)
+    assert len(small.table) == 2**15
+    rgb = (92, 139, 195)
+    masked = (92 & small.mask, 139 & small.mask, 195 & small.mask)
+    assert small[rgb] == min(colors, key=lambda c: manhattan(masked, c))
+
+
+example_matching_3_full = """
+This is practical for the full image.
+
+>>> colors = get_colors()
+>>> img = Image.open("IMG_2705.jpg")
+>>> indices, best = nearest_palette(image_array(img), colors)
+>>> indices.shape
+(2736, 3648)
+"""
+
 REPL_noise_bits = """
 >>> r = 15
 >>> r_f = 15/256
@@ -367,6 +825,107 @@ def simplify_colors(
     return subset
 
 
+class ColorHistogram(NamedTuple):
+    """
+    The distinct colors of an image, packed as 0xRRGGBB, in ascending order,
+    with their pixel counts.
+
+    Optionally, ``positions`` has every pixel's index, ``x * height + y``,
+    grouped by color: ``positions[starts[i]:starts[i + 1]]`` are the pixels
+    of ``colors[i]``, in ``pixel_iter()`` order.
+    """
+
+    colors: NDArray[np.int32]
+    counts: NDArray[np.intp]
+    height: int
+    positions: NDArray[np.int32] | None = None
+    starts: NDArray[np.intp] | None = None
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.colors, self.counts, self.positions, self.starts)
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    def rgb_iter(self) -> Iterator[RGB]:
+        for c in self.colors.tolist():
+            yield c >> 16, (c >> 8) & 0xFF, c & 0xFF
+
+    def points(self, rgb: RGB) -> list[Point]:
+        if self.positions is None or self.starts is None:
+            raise ValueError("histogram built without coordinates")
+        r, g, b = rgb
+        packed = (r << 16) | (g << 8) | b
+        i = int(np.searchsorted(self.colors, packed))
+        if i == len(self.colors) or self.colors[i] != packed:
+            return []
+        pixels = self.positions[self.starts[i] : self.starts[i + 1]].tolist()
+        return [divmod(p, self.height) for p in pixels]
+
+
+def color_histogram(img: Image, coordinates: bool = False) -> ColorHistogram:
+    """
+    Counts with ``np.bincount()`` over all 2**24 packed colors, keeping only
+    the nonzero bins. With coordinates, a stable sort groups pixel indices
+    by color without disturbing their order.
+    """
+    pixels = image_array(img).transpose(1, 0, 2)
+    height = pixels.shape[1]
+    packed = pack_rgb(pixels).ravel()
+    if not coordinates:
+        all_counts = np.bincount(packed, minlength=1 << 24)
+        colors = np.flatnonzero(all_counts).astype(np.int32)
+        return ColorHistogram(colors, all_counts[colors], height)
+    positions = np.argsort(packed, kind="stable").astype(np.int32)
+    colors, starts, counts = np.unique(
+        packed[positions], return_index=True, return_counts=True
+    )
+    starts = np.append(starts, len(positions))
+    return ColorHistogram(colors, counts, height, positions, starts)
+
+
+def gather_histogram(coordinates: bool = False) -> ColorHistogram:
+    img = Image.open("IMG_2705.jpg")
+    histogram = color_histogram(img, coordinates)
+
+    w, h = img.size
+    print(f"total pixels {w*h}")
+    print(f"total colors {len(histogram.colors)}")
+    print(f"histogram bytes {histogram.nbytes:,d}")
+    return histogram
+
+
+def simplify_histogram(histogram: ColorHistogram, mask: int) -> Counter[RGB]:
+    """The same result as ``simplify_colors()``, from a histogram."""
+    masked = histogram.colors & ((mask << 16) | (mask << 8) | mask)
+    subset_colors, subset_counts = np.unique(masked, return_counts=True)
+    return Counter(
+        {
+            (c >> 16, (c >> 8) & 0xFF, c & 0xFF): n
+            for c, n in zip(subset_colors.tolist(), subset_counts.tolist())
+        }
+    )
+
+
+def test_color_histogram() -> None:
+    img = Image.open("IMG_2705.jpg").crop((0, 0, 40, 30))
+    palette = defaultdict(list)
+    for xy, rgb in pixel_iter(img):
+        palette[rgb].append(xy)
+
+    histogram = color_histogram(img)
+    assert histogram.positions is None
+    assert list(histogram.rgb_iter()) == sorted(palette)
+    assert histogram.counts.tolist() == [len(palette[c]) for c in sorted(palette)]
+    for mask in (0b1110_0000, 0b1111_1100):
+        assert simplify_histogram(histogram, mask) == simplify_colors(palette, mask)
+
+    located = color_histogram(img, coordinates=True)
+    assert located.counts.tolist() == histogram.counts.tolist()
+    assert all(located.points(rgb) == palette[rgb] for rgb in palette)
+    assert located.points((1, 2, 3)) == []
+    assert located.nbytes > histogram.nbytes
+
+
 REPL_mask = """
 >>> bin(200)
 '0b11001000'
@@ -390,6 +949,12 @@ total colors 194537
 0b11111000 5296
 0b11111100 25182
 
+>>> histogram = gather_histogram()  # doctest: +ELLIPSIS
+total pixels 9980928
+total colors 194537
+histogram bytes ...
+>>> for m in masks:
+...     assert simplify_histogram(histogram, m) == subsets[m]
 """
 
 from collections.abc import Sequence
@@ -419,25 +984,155 @@ Color(rgb=(219, 215, 210), name='Timberwolf')
 """
 
 
-def clone_picture(color_map: dict[RGB, Color], filename: str = "IMG_2705.jpg") -> None:
-    mask = 0b1110_0000
+def remap_pixels(
+    pixels: NDArray[np.uint8],
+    color_map: dict[RGB, Color] | PaletteIndex,
+    mask: int = 0b1110_0000,
+) -> NDArray[np.uint8]:
+    """
+    Replaces every pixel in an (..., 3) array in one pass.
+    A ``dict`` is consulted once per distinct masked color.
+    The ``mask`` only applies to a ``dict``, and must match its keys.
+    A :class:`PaletteIndex` ignores it; the index's ``bits`` do the masking.
+    """
+    if isinstance(color_map, PaletteIndex):
+        palette = palette_array(color_map.colors).astype(np.uint8)
+        remapped: NDArray[np.uint8] = palette[color_map.lookup_array(pixels)]
+        return remapped
+    distinct, inverse = np.unique(pack_rgb(pixels & mask).ravel(), return_inverse=True)
+    replacements = np.array(
+        [
+            color_map[(k >> 16, (k >> 8) & 0xFF, k & 0xFF)].rgb
+            for k in distinct.tolist()
+        ],
+        dtype=np.uint8,
+    )
+    remapped = replacements[inverse].reshape(pixels.shape)
+    return remapped
+
+
+def clone_image(
+    img: Image,
+    color_map: dict[RGB, Color] | PaletteIndex,
+    mask: int = 0b1110_0000,
+) -> Image:
+    remapped = remap_pixels(image_array(img), color_map, mask)
+    return Image.frombytes("RGB", img.size, remapped.tobytes())
+
+
+def clone_picture(
+    color_map: dict[RGB, Color] | PaletteIndex,
+    filename: str = "IMG_2705.jpg",
+    mask: int = 0b1110_0000,
+) -> None:
+    """
+    The ``mask`` matches the keys of a ``dict`` color map.
+    It's ignored for a :class:`PaletteIndex`, which masks with its own ``bits``.
+    """
     img = Image.open(filename)
-    clone = img.copy()
-    for xy, rgb in pixel_iter(img):
-        r, g, b = rgb
-        repl = color_map[(mask & r, mask & g, mask & b)]
-        clone.putpixel(xy, repl.rgb)
+    clone = clone_image(img, color_map, mask)
     clone.show()
 
 
+def test_clone_image() -> None:
+    mask = 0b1110_0000
+    img = Image.open("IMG_2705.jpg").crop((0, 0, 24, 16))
+    colors = get_colors()
+    color_map = make_color_map(colors)
+    expected = img.copy()
+    for xy, (r, g, b) in pixel_iter(img):
+        expected.putpixel(xy, color_map[(mask & r, mask & g, mask & b)].rgb)
+    assert clone_image(img, color_map, mask).tobytes() == expected.tobytes()
+
+    index = PaletteIndex(colors[::19], bits=3)
+    for xy, rgb in pixel_iter(img):
+        expected.putpixel(xy, index[rgb].rgb)
+    assert clone_image(img, index).tobytes() == expected.tobytes()
+
+
+from concurrent import futures
+import os
+
+ColorMap = dict[RGB, Color] | PaletteIndex
+
+worker_color_map: tuple[ColorMap, int] | None = None
+
+
+def init_worker(color_map: ColorMap, mask: int) -> None:
+    """Each worker process gets the color map once, not once per band."""
+    global worker_color_map
+    worker_color_map = (color_map, mask)
+
+
+def remap_band(band: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    assert worker_color_map is not None, "init_worker() not called"
+    color_map, mask = worker_color_map
+    return remap_pixels(band, color_map, mask)
+
+
+def clone_image_parallel(
+    img: Image,
+    color_map: ColorMap,
+    mask: int = 0b1110_0000,
+    workers: int | None = None,
+    band_rows: int | None = None,
+) -> Image:
+    """
+    ``clone_image()`` with the image split into bands of ``band_rows`` rows.
+    Each band is recolored in a worker process; the results are stacked
+    back together in order. By default, there are about 4 bands per worker.
+    """
+    workers = workers or os.cpu_count() or 1
+    pixels = image_array(img)
+    height = pixels.shape[0]
+    band_rows = band_rows or max(1, -(-height // (4 * workers)))
+    bands = (pixels[top : top + band_rows] for top in range(0, height, band_rows))
+    with futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(color_map, mask)
+    ) as executor:
+        remapped = np.concatenate(list(executor.map(remap_band, bands)))
+    return Image.frombytes("RGB", img.size, remapped.tobytes())
+
+
+def test_clone_image_parallel() -> None:
+    img = Image.open("IMG_2705.jpg").crop((0, 0, 24, 16))
+    colors = get_colors()
+    color_map = make_color_map(colors)
+    expected = clone_image(img, color_map)
+    clone = clone_image_parallel(img, color_map, workers=2, band_rows=5)
+    assert clone.tobytes() == expected.tobytes()
+
+    index = PaletteIndex(colors[::19], bits=4)
+    clone = clone_image_parallel(img, index, workers=2)
+    assert clone.tobytes() == clone_image(img, index).tobytes()
+
+
 import time
 
 
-def demo_clone_picture() -> None:
+def demo_clone_picture(workers: int | None = None, show: bool = True) -> None:
+    """Compares one process with ``workers`` processes."""
+    workers = workers or os.cpu_count() or 1
     start = time.perf_counter()
     color_map = make_color_map(get_colors())
-    clone_picture(color_map)
-    print(time.perf_counter() - start, "seconds")
+    print(f"color map {time.perf_counter() - start:.3f} seconds")
+    img = Image.open("IMG_2705.jpg")
+
+    start = time.perf_counter()
+    serial = clone_image(img, color_map)
+    serial_time = time.perf_counter() - start
+    print(f"1 process {serial_time:.3f} seconds")
+
+    start = time.perf_counter()
+    clone = clone_image_parallel(img, color_map, workers=workers)
+    parallel_time = time.perf_counter() - start
+    print(
+        f"{workers} processes {parallel_time:.3f} seconds, "
+        f"speedup {serial_time / parallel_time:.2f}x"
+    )
+    assert clone.tobytes() == serial.tobytes()
+    if show:
+        clone.show()
 
 
 def performance() -> None:
@@ -528,5 +1223,22 @@ REPL_combinations = """
 
 __test__ = {name: value for name, value in globals().items() if name.startswith("REPL")}
 
+import argparse
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Chapter 9 image demos")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("performance", help="distance function timings (default)")
+    clone = commands.add_parser("clone", help="time clone_picture, serial vs. tiled")
+    clone.add_argument("--workers", type=int, default=None)
+    clone.add_argument("--no-show", dest="show", action="store_false")
+    options = parser.parse_args(argv)
+    if options.command == "clone":
+        demo_clone_picture(options.workers, options.show)
+    else:
+        performance()
+
+
 if __name__ == "__main__":
-    performance()
+    main()
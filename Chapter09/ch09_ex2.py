@@ -84,6 +84,313 @@ def performance() -> None:
     print(f"10! hands in {perf/100:.3f} seconds")
 
 
+import math
+
+
+def hungarian_potentials(
+    cost: list[tuple[int, ...]]
+) -> tuple[list[float], list[float], list[int]]:
+    """
+    Kuhn-Munkres, in O(n**3).
+
+    Returns the row potentials, ``u``, and column potentials, ``v``,
+    of an optimal dual solution, and one optimal assignment, ``perm``,
+    in the form used by :func:`assignment`: ``perm[agent]`` is the task.
+    """
+    n = len(cost)
+    u = [0.0] * (n + 1)
+    v = [0.0] * (n + 1)
+    p = [0] * (n + 1)  # p[j] is the 1-based row assigned to column j
+    way = [0] * (n + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [math.inf] * (n + 1)
+        used = [False] * (n + 1)
+        while p[j0] != 0:
+            used[j0] = True
+            i0 = p[j0]
+            row, u_i0 = cost[i0 - 1], u[i0]
+            delta, j1 = math.inf, 0
+            for j in range(1, n + 1):
+                if not used[j]:
+                    reduced = row[j - 1] - u_i0 - v[j]
+                    if reduced < minv[j]:
+                        minv[j], way[j] = reduced, j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            for j in range(n + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+        while j0 != 0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    return u[1:], v[1:], [p[j] - 1 for j in range(1, n + 1)]
+
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+def realign(
+    tight: list[list[int]], matching: list[int], column: int, row: int
+) -> list[int] | None:
+    """
+    A perfect matching that agrees with ``matching`` for columns before
+    ``column`` and matches ``row`` to ``column``, or None.
+    The column that had ``row`` searches for an alternating path, through
+    the unfixed columns, to the row ``column`` gives up.
+    """
+    if matching[column] == row:
+        return matching
+    owner = [0] * len(matching)
+    for c, r in enumerate(matching):
+        owner[r] = c
+    start, target = owner[row], matching[column]
+    parent: dict[int, int] = {}
+    queue = deque([start])
+    while queue and target not in parent:
+        c = queue.popleft()
+        for r in tight[c]:
+            if r == row or r in parent or owner[r] < column:
+                continue
+            parent[r] = c
+            if r == target:
+                break
+            queue.append(owner[r])
+    if target not in parent:
+        return None
+    revised = list(matching)
+    revised[column] = row
+    r = target
+    while True:
+        c = parent[r]
+        r, revised[c] = revised[c], r
+        if c == start:
+            return revised
+
+
+def perfect_matchings(
+    tight: list[list[int]], matching: list[int]
+) -> Iterator[tuple[int, ...]]:
+    """
+    All perfect matchings of the bipartite graph, ``tight[column]`` rows,
+    in lexicographic order, given one of them.
+    Every branch explored leads to at least one matching.
+    """
+    n = len(tight)
+    stack = [(0, matching)]
+    while stack:
+        column, partial = stack.pop()
+        if column == n:
+            yield tuple(partial)
+            continue
+        fixed = set(partial[:column])
+        children = (
+            realign(tight, partial, column, row)
+            for row in tight[column]
+            if row not in fixed
+        )
+        stack.extend((column + 1, child) for child in reversed(list(children)) if child)
+
+
+def hungarian(cost: list[tuple[int, ...]]) -> list[tuple[int, ...]]:
+    """
+    All the optimal assignments, like :func:`assignment`.
+
+    Every optimal assignment uses only the "tight" cells, where the cost
+    equals the sum of the optimal dual potentials (complementary slackness).
+    Enumerating the perfect matchings of those cells finds them all.
+    """
+    u, v, matching = hungarian_potentials(cost)
+    n = len(cost)
+    tight = [
+        [task for task in range(n) if cost[task][agent] - u[task] - v[agent] == 0]
+        for agent in range(n)
+    ]
+    return list(perfect_matchings(tight, matching))
+
+
+REPL_hungarian = """
+>>> cost = get_cost_matrix()
+>>> hungarian(cost)
+[(2, 4, 6, 1, 5, 3, 0), (2, 6, 0, 1, 5, 3, 4)]
+"""
+
+
+from itertools import accumulate
+
+
+def greedy_total(cost: list[tuple[int, ...]]) -> int:
+    """Each agent takes the cheapest remaining task: an upper bound."""
+    n = len(cost)
+    remaining = set(range(n))
+    total = 0
+    for agent in range(n):
+        task = min(remaining, key=lambda t: cost[t][agent])
+        remaining.remove(task)
+        total += cost[task][agent]
+    return total
+
+
+def branch_and_bound(
+    cost: list[tuple[int, ...]], prefix: tuple[int, ...] = (), bound: float = math.inf
+) -> tuple[float, list[tuple[int, ...]]]:
+    """
+    The best total, and all the assignments starting with ``prefix``
+    that have that total, if it's no more than ``bound``.
+
+    Assignments are built one agent at a time. A partial assignment
+    is pruned when its cost, plus each remaining agent's cheapest task,
+    exceeds the best total found so far. Ties aren't pruned.
+    """
+    n = len(cost)
+    cheapest = [min(cost[task][agent] for task in range(n)) for agent in range(n)]
+    # remaining[k] is a lower bound on the cost of agents k to n-1.
+    remaining = list(accumulate(reversed(cheapest), initial=0))[::-1]
+    best = bound
+    solutions: list[tuple[int, ...]] = []
+    perm = list(prefix)
+    used = set(prefix)
+
+    def search(agent: int, partial: int) -> None:
+        nonlocal best, solutions
+        if agent == n:
+            if partial < best:
+                best, solutions = partial, [tuple(perm)]
+            elif partial == best:
+                solutions.append(tuple(perm))
+            return
+        # Cheapest first, to lower the best total early.
+        for task in sorted(range(n), key=lambda t: cost[t][agent]):
+            total = partial + cost[task][agent]
+            if task in used or total + remaining[agent + 1] > best:
+                continue
+            used.add(task)
+            perm.append(task)
+            search(agent + 1, total)
+            perm.pop()
+            used.remove(task)
+
+    search(len(prefix), sum(cost[task][agent] for agent, task in enumerate(prefix)))
+    return best, solutions
+
+
+def assignment_bnb(cost: list[tuple[int, ...]]) -> list[tuple[int, ...]]:
+    """The same results as :func:`assignment`, by branch and bound."""
+    _, solutions = branch_and_bound(cost, bound=greedy_total(cost))
+    return sorted(solutions)
+
+
+from concurrent import futures
+from itertools import repeat
+
+
+def assignment_bnb_parallel(
+    cost: list[tuple[int, ...]], workers: int | None = None
+) -> list[tuple[int, ...]]:
+    """
+    :func:`assignment_bnb` with the first agent's task choices searched
+    in separate processes. Each starts with the greedy bound.
+    With fewer than two agents there's nothing to split up.
+    """
+    n = len(cost)
+    if n < 2:
+        return assignment_bnb(cost)
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                branch_and_bound,
+                repeat(cost),
+                [(task,) for task in range(n)],
+                repeat(greedy_total(cost)),
+            )
+        )
+    best = min(total for total, _ in results)
+    return sorted(
+        solution
+        for total, solutions in results
+        if total == best
+        for solution in solutions
+    )
+
+
+import random
+
+
+def random_cost(n: int, high: int, rng: random.Random) -> list[tuple[int, ...]]:
+    return [tuple(rng.randint(0, high) for _ in range(n)) for _ in range(n)]
+
+
+def test_hungarian() -> None:
+    assert hungarian(get_cost_matrix()) == assignment(get_cost_matrix())
+    rng = random.Random(42)
+    for n in range(1, 7):
+        for high in (1, 3, 50):
+            cost = random_cost(n, high, rng)
+            assert hungarian(cost) == assignment(cost), cost
+    assert len(hungarian([(1,) * 5] * 5)) == 120
+
+
+def test_branch_and_bound() -> None:
+    assert assignment_bnb(get_cost_matrix()) == assignment(get_cost_matrix())
+    rng = random.Random(42)
+    for n in range(1, 7):
+        for high in (1, 3, 50):
+            cost = random_cost(n, high, rng)
+            assert assignment_bnb(cost) == assignment(cost), cost
+    cost = random_cost(7, 3, rng)
+    assert assignment_bnb_parallel(cost, workers=2) == assignment(cost)
+    assert assignment_bnb_parallel([]) == assignment([]) == [()]
+    assert assignment_bnb_parallel([(5,)]) == assignment([(5,)]) == [(0,)]
+
+
+def performance_hungarian(
+    sizes: Iterable[int] = (7, 8, 9, 10, 12, 20, 50, 100, 200, 500),
+    high: int = 10**6,
+) -> None:
+    """
+    Compares brute force (up to n=9), and branch and bound (up to n=12),
+    with Kuhn-Munkres.
+    The time to enumerate all optima depends on how many there are:
+    a narrow range of costs has many ties.
+    """
+    import time
+
+    rng = random.Random(42)
+    print(
+        f"{'n':>4s} {'permutations':>12s} {'branch/bound':>12s} "
+        f"{'hungarian':>10s} {'all optima':>10s}"
+    )
+    for n in sizes:
+        cost = random_cost(n, high, rng)
+        brute = "-"
+        if n <= 9:
+            start = time.perf_counter()
+            assignment(cost)
+            brute = f"{time.perf_counter() - start:.3f}"
+        bnb = "-"
+        if n <= 12:
+            start = time.perf_counter()
+            assignment_bnb(cost)
+            bnb = f"{time.perf_counter() - start:.3f}"
+        start = time.perf_counter()
+        hungarian_potentials(cost)
+        one = time.perf_counter() - start
+        start = time.perf_counter()
+        solutions = hungarian(cost)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{n:4d} {brute:>12s} {bnb:>12s} "
+            f"{one:10.3f} {elapsed:10.3f} ({len(solutions)})"
+        )
+
+
 REPL_combinations = """
 >>> from itertools import combinations, product
 
@@ -106,8 +413,190 @@ REPL_combinations = """
 2598960
 """
 
+from math import comb
+from collections.abc import Sequence
+
+
+def rank_combination(combination: Sequence[int], n: int) -> int:
+    """
+    Position of a sorted combination in ``combinations(range(n), k)``.
+
+    >>> rank_combination((0, 1, 2), 5), rank_combination((2, 3, 4), 5)
+    (0, 9)
+    """
+    k = len(combination)
+    return (
+        comb(n, k) - 1 - sum(comb(n - 1 - c, k - i) for i, c in enumerate(combination))
+    )
+
+
+def unrank_combination(rank: int, n: int, k: int) -> tuple[int, ...]:
+    """
+    The combination at position ``rank`` of ``combinations(range(n), k)``.
+
+    >>> unrank_combination(9, 5, 3)
+    (2, 3, 4)
+    """
+    x = comb(n, k) - 1 - rank
+    combination = []
+    v = n
+    for i in range(k):
+        v -= 1
+        while comb(v, k - i) > x:
+            v -= 1
+        x -= comb(v, k - i)
+        combination.append(n - 1 - v)
+    return tuple(combination)
+
+
+def combinations_from(
+    n: int, k: int, start: int, count: int
+) -> Iterator[tuple[int, ...]]:
+    """
+    ``islice(combinations(range(n), k), start, start + count)``,
+    without generating the ``start`` combinations before it.
+    """
+    current = list(unrank_combination(start, n, k))
+    for _ in range(min(count, comb(n, k) - start)):
+        yield tuple(current)
+        i = k - 1
+        while i >= 0 and current[i] == n - k + i:
+            i -= 1
+        if i < 0:
+            return
+        current[i] += 1
+        for j in range(i + 1, k):
+            current[j] = current[j - 1] + 1
+
+
+SUITS = "♠♥♦♣"
+Card = tuple[int, str]
+
+
+def card_index(card: Card) -> int:
+    """Position in ``product(range(13), SUITS)``: ``rank * 4 + suit``."""
+    rank, suit = card
+    return rank * 4 + SUITS.index(suit)
+
+
+def encode_hand(cards: Iterable[Card]) -> int:
+    """A hand as a 52-bit mask, one bit per card."""
+    return sum(1 << card_index(card) for card in set(cards))
+
+
+def decode_hand(mask: int) -> list[Card]:
+    return [(c // 4, SUITS[c % 4]) for c in range(52) if mask & (1 << c)]
+
+
+RANK_MASKS = [0b1111 << (4 * rank) for rank in range(13)]
+SUIT_MASKS = [sum(1 << (4 * rank + suit) for rank in range(13)) for suit in range(4)]
+
+
+def rank_pattern(mask: int) -> tuple[int, ...]:
+    """
+    Counts of cards of each rank, largest first: (3, 2) is a full house.
+
+    >>> rank_pattern(encode_hand([(0, '♠'), (0, '♥'), (5, '♦'), (5, '♣'), (5, '♠')]))
+    (3, 2)
+    """
+    counts = ((mask & rank_mask).bit_count() for rank_mask in RANK_MASKS)
+    return tuple(sorted((c for c in counts if c), reverse=True))
+
+
+def is_flush(mask: int) -> bool:
+    return any((mask & suit_mask).bit_count() >= 5 for suit_mask in SUIT_MASKS)
+
+
+def combination_mask(combination: Iterable[int]) -> int:
+    return sum(1 << c for c in combination)
+
+
+from collections import Counter
+from collections.abc import Callable, Hashable
+from typing import TypeVar
+
+H = TypeVar("H", bound=Hashable)
+
+
+def count_chunk(
+    n: int, k: int, start: int, count: int, classify: Callable[[int], H]
+) -> Counter[H]:
+    """Map: classify the masks of one contiguous run of combinations."""
+    return Counter(
+        classify(combination_mask(c)) for c in combinations_from(n, k, start, count)
+    )
+
+
+def map_reduce_combinations(
+    classify: Callable[[int], H],
+    n: int = 52,
+    k: int = 5,
+    workers: int | None = None,
+    chunks: int = 64,
+) -> Counter[H]:
+    """
+    Counts ``classify(mask)`` over every k-card hand from an n-card deck.
+    The space is split by rank into ``chunks`` runs; each worker unranks
+    its starting combination and steps forward from there.
+    ``classify`` must be a module-level function so it can be pickled.
+    """
+    total = comb(n, k)
+    size = -(-total // chunks)
+    starts = range(0, total, size)
+    combined: Counter[H] = Counter()
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for counts in executor.map(
+            count_chunk, repeat(n), repeat(k), starts, repeat(size), repeat(classify)
+        ):
+            combined.update(counts)
+    return combined
+
+
+def test_combinatorics() -> None:
+    from itertools import combinations, product
+
+    for n, k in ((1, 1), (6, 2), (10, 4), (12, 12)):
+        expected = list(combinations(range(n), k))
+        assert [rank_combination(c, n) for c in expected] == list(range(len(expected)))
+        assert [unrank_combination(r, n, k) for r in range(len(expected))] == expected
+        assert list(combinations_from(n, k, 0, len(expected) + 1)) == expected
+        assert (
+            list(combinations_from(n, k, 3 % len(expected), 5))
+            == expected[3 % len(expected) : 3 % len(expected) + 5]
+        )
+
+    deck = list(product(range(13), SUITS))
+    assert [card_index(card) for card in deck] == list(range(52))
+    hand = [deck[3], deck[17], deck[51]]
+    assert decode_hand(encode_hand(hand)) == hand
+    assert combination_mask([3, 17, 51]) == encode_hand(hand)
+
+    small_deck = combinations(range(20), 5)
+    expected_counts = Counter(rank_pattern(combination_mask(c)) for c in small_deck)
+    assert map_reduce_combinations(rank_pattern, 20, 5, workers=2, chunks=7) == (
+        expected_counts
+    )
+
+
+example_poker_hands = """
+Takes about 20 seconds on one core.
+
+>>> patterns = map_reduce_combinations(rank_pattern)
+>>> for pattern, count in sorted(patterns.items()):
+...     print(pattern, count)
+(1, 1, 1, 1, 1) 1317888
+(2, 1, 1, 1) 1098240
+(2, 2, 1) 123552
+(3, 1, 1) 54912
+(3, 2) 3744
+(4, 1) 624
+>>> map_reduce_combinations(is_flush)[True]
+5148
+"""
+
 __test__ = {name: value for name, value in globals().items() if name.startswith("REPL")}
 
 
 if __name__ == "__main__":
     performance()
+    performance_hungarian()
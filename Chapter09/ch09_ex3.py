@@ -404,6 +404,7 @@ def column(source: Iterable[list[T]], x: int) -> Iterator[T]:
 from collections.abc import Iterator
 from itertools import *
 from Chapter04.ch04_ex4 import corr
+from pytest import approx
 
 
 def multi_corr(source: list[list[float]]) -> Iterator[tuple[float, float, float]]:
@@ -417,6 +418,81 @@ def multi_corr(source: list[list[float]]) -> Iterator[tuple[float, float, float]
         yield header_p, header_q, r_pq
 
 
+from collections.abc import Sequence
+from typing import Any
+import numpy as np
+from numpy.typing import NDArray
+
+
+def correlation_matrix(
+    source: Sequence[Sequence[Any]],
+) -> tuple[list[str], NDArray[np.float64]]:
+    """
+    Standardize each column once, then compute every Pearson r
+    with a single matrix product, :math:`R = Z^T Z / N`.
+    The standardization uses the population stdev, like :func:`corr`.
+
+    >>> headers, r = correlation_matrix([("x", "y"), (1, 2), (2, 4), (3, 5)])
+    >>> headers
+    ['x', 'y']
+    >>> round(float(r[0, 1]), 4)
+    0.982
+    """
+    headers = list(source[0])
+    data = np.array(source[1:], dtype=np.float64)
+    z = (data - data.mean(axis=0)) / data.std(axis=0)
+    r: NDArray[np.float64] = (z.T @ z) / len(data)
+    return headers, r
+
+
+def multi_corr_matrix(
+    source: Sequence[Sequence[Any]],
+) -> Iterator[tuple[str, str, float]]:
+    """
+    The same ``(header_p, header_q, r)`` triples as :func:`multi_corr`,
+    in the same order, from one :func:`correlation_matrix`.
+    """
+    headers, r = correlation_matrix(source)
+    for p, q in combinations(range(len(headers)), 2):
+        if headers[p] == headers[q]:
+            continue
+        yield headers[p], headers[q], float(r[p, q])
+
+
+def test_multi_corr_matrix() -> None:
+    source = list(convert(column_data(s7, s3890, s43)))
+    expected: list[tuple[Any, Any, float]] = list(
+        multi_corr(source)  # type: ignore[arg-type]
+    )
+    actual = list(multi_corr_matrix(source))
+    assert [(p, q) for p, q, _ in actual] == [(p, q) for p, q, _ in expected]
+    assert [r for _, _, r in actual] == approx([r for _, _, r in expected])
+
+
+def example_wide_corr(series: int = 2_000, samples: int = 50) -> None:
+    """
+    A wide table of random series. The pairwise :func:`multi_corr`
+    is timed on a slice; the matrix version does all pairs.
+    """
+    import time
+
+    rng = np.random.default_rng(42)
+    data = rng.normal(size=(samples, series))
+    source = [[f"s{i}" for i in range(series)]] + data.tolist()
+    start = time.perf_counter()
+    pairs = sum(1 for _ in multi_corr_matrix(source))
+    matrix_time = time.perf_counter() - start
+    narrow = [row[:100] for row in source]
+    start = time.perf_counter()
+    narrow_pairs = sum(1 for _ in multi_corr(narrow))
+    pairwise_time = time.perf_counter() - start
+    print(f"matrix:   {pairs:9,d} pairs {matrix_time:8.3f} s")
+    print(
+        f"pairwise: {narrow_pairs:9,d} pairs {pairwise_time:8.3f} s"
+        f" (estimated {pairwise_time * pairs / narrow_pairs:,.0f} s for all)"
+    )
+
+
 REPL_multi_corr = """
 >>> source = list(convert(column_data(s7, s3890, s43)))
 >>> len( source )
@@ -28,6 +28,8 @@ def test_urllib_get() -> None:
 
 
 from unittest.mock import Mock, MagicMock, call
+from collections.abc import Iterator
+from typing import Any
 
 
 @pytest.fixture
@@ -75,5 +77,156 @@ def client_demo(url: str, save_as: Path) -> None:
             result.write(body)
 
 
+# A pool of keep-alive connections, for clients making many requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable
+from types import TracebackType
+from urllib.parse import urlsplit
+import threading
+
+HostKey = tuple[str, str, int]
+
+
+class ConnectionPool:
+    """
+    Reuses HTTP/1.1 keep-alive connections, at most ``max_per_host`` per host.
+
+    ``get()`` has the same contract as ``urllib_get()``.
+    ``get_many()`` runs requests concurrently, ``max_workers`` at a time.
+    Connections the server closes (e.g., HTTP/1.0 servers) are not pooled.
+    """
+
+    def __init__(
+        self, max_per_host: int = 4, max_workers: int = 8, timeout: float = 10.0
+    ) -> None:
+        self.max_per_host = max_per_host
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._idle: defaultdict[
+            HostKey, list[http.client.HTTPConnection]
+        ] = defaultdict(list)
+        self._limits: dict[HostKey, threading.BoundedSemaphore] = {}
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+            self._idle.clear()
+
+    def _limit(self, key: HostKey) -> threading.BoundedSemaphore:
+        with self._lock:
+            return self._limits.setdefault(
+                key, threading.BoundedSemaphore(self.max_per_host)
+            )
+
+    def _acquire(self, key: HostKey) -> tuple[http.client.HTTPConnection, bool]:
+        """An idle connection (reused is True) or a new one."""
+        with self._lock:
+            if self._idle[key]:
+                return self._idle[key].pop(), True
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout), False
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _release(self, key: HostKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle[key].append(connection)
+
+    def get(self, url: str) -> tuple[int, str]:
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname or "localhost", port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        with self._limit(key):
+            while True:
+                connection, reused = self._acquire(key)
+                try:
+                    connection.request("GET", path)
+                    response = connection.getresponse()
+                    body_bytes = response.read()
+                except ConnectionError:
+                    # A pooled connection may have been closed by the server.
+                    connection.close()
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    connection.close()
+                    raise
+                break
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+        encoding = response.headers.get_content_charset("utf-8")
+        return response.status, body_bytes.decode(encoding)
+
+    def get_many(self, urls: Iterable[str]) -> list[tuple[int, str]]:
+        """Results are in the same order as the URLs."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.get, urls))
+
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Echoes the path; counts the connections made to the server."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        KeepAliveHandler.connections += 1
+
+    def do_GET(self) -> None:
+        content = self.path.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def keep_alive_server() -> Iterator[str]:
+    KeepAliveHandler.connections = 0
+    httpd = ThreadingHTTPServer(("localhost", 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_connection_pool(keep_alive_server: str) -> None:
+    urls = [f"{keep_alive_server}/item/{n}" for n in range(50)]
+    with ConnectionPool(max_per_host=2) as pool:
+        assert pool.get(f"{keep_alive_server}/?q=1") == (200, "/?q=1")
+        results = pool.get_many(urls)
+    assert results == [(200, f"/item/{n}") for n in range(50)]
+    assert KeepAliveHandler.connections <= 2
+
+
 if __name__ == "__main__":
     urllib_get("https://slott-softwarearchitect.blogspot.com")
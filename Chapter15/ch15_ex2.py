@@ -4,12 +4,16 @@ Chapter 15, Example Set 2
 """
 
 from http.server import HTTPServer, SimpleHTTPRequestHandler
-from typing import NoReturn
+import sys
+from typing import NoReturn, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from Chapter15.conftest import RunningServer
 
-def server_demo() -> NoReturn:
-    httpd = HTTPServer(("localhost", 8080), SimpleHTTPRequestHandler)
-    print(f"Serving on http://localhost:8080...")
+
+def server_demo(port: int = 8080) -> NoReturn:
+    httpd = HTTPServer(("localhost", port), SimpleHTTPRequestHandler)
+    print(f"Serving on http://localhost:{port}...")
     while True:
         httpd.handle_request()
     httpd.shutdown()
@@ -30,13 +34,25 @@ import pytest
 
 
 @pytest.mark.server_file("Chapter15/ch15_ex2.py")
-def test_server(running_server: Path) -> None:
+def test_server(running_server: "RunningServer") -> None:
     expected_body = (Path.cwd() / "Chapter15" / "demo.file").read_text()
-    status, body = urllib_get("http://localhost:8080/Chapter15/demo.file")
+    status, body = urllib_get(f"{running_server.url}/Chapter15/demo.file")
     assert body == expected_body
     assert status == 200
 
 
+from Chapter15.ch15_ex1 import ConnectionPool
+
+
+@pytest.mark.server_file("Chapter15/ch15_ex2.py")
+def test_server_pool(running_server: "RunningServer") -> None:
+    expected_body = (Path.cwd() / "Chapter15" / "demo.file").read_text()
+    urls = [f"{running_server.url}/Chapter15/demo.file"] * 10
+    with ConnectionPool(max_per_host=2) as pool:
+        results = pool.get_many(urls)
+    assert results == [(200, expected_body)] * 10
+
+
 if __name__ == "__main__":
     print("Starting demo")
-    server_demo()
+    server_demo(int(sys.argv[1]) if len(sys.argv) > 1 else 8080)
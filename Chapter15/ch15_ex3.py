@@ -9,12 +9,16 @@ import wsgiref.util
 import urllib
 import urllib.parse
 from pathlib import Path
+import os
 import sys
+from typing import NamedTuple
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from _typeshed import OptExcInfo
     from _typeshed.wsgi import WSGIApplication, WSGIEnvironment, StartResponse
+    from Chapter15.conftest import RunningServer
 
 from textwrap import dedent
 
@@ -94,20 +98,72 @@ INDEX_TEMPLATE_FOOT = dedent(
 )
 
 
+INDEX_TEMPLATE_ENTRY = '<p><a href="/static/{0}">{1}</a></p>'
+
+INDEX_TEMPLATE_NAV = '<p><a href="?page={0}">{1}</a></p>'
+
+INDEX_PAGE_SIZE = 1000
+
+
+class DirectoryIndex(NamedTuple):
+    """A directory's visible entry names, valid while its mtime is unchanged."""
+
+    mtime_ns: int
+    names: list[str]
+
+
+INDEX_CACHE: dict[Path, DirectoryIndex] = {}
+
+
+def directory_names(directory: Path) -> list[str]:
+    """
+    Sorted, non-hidden names in a directory.
+    The listing is cached and rebuilt only when the directory's mtime changes;
+    adding, removing, or renaming an entry updates the directory's mtime.
+    """
+    mtime_ns = directory.stat().st_mtime_ns
+    cached = INDEX_CACHE.get(directory)
+    if cached is None or cached.mtime_ns != mtime_ns:
+        with os.scandir(directory) as entries:
+            names = sorted(
+                entry.name for entry in entries if not entry.name.startswith(".")
+            )
+        cached = DirectoryIndex(mtime_ns, names)
+        INDEX_CACHE[directory] = cached
+    return cached.names
+
+
+def page_number(environ: "WSGIEnvironment") -> int:
+    """The 1-based ``?page=n`` query parameter, defaulting to 1."""
+    query = urllib.parse.parse_qs(environ.get("QUERY_STRING", ""))
+    try:
+        return max(1, int(query["page"][0]))
+    except (KeyError, ValueError):
+        return 1
+
+
 def index_app(
     environ: "WSGIEnvironment", start_response: "StartResponse"
 ) -> Iterable[bytes]:
-    """Displays an index of available files."""
+    """Displays a page of the index of available files."""
     log = environ["wsgi.errors"]
     print("PATH_INFO '{0}'".format(environ["PATH_INFO"]), file=log)
-    page = INDEX_TEMPLATE_HEAD.format(environ.get("PATH_INFO", "."))
-    for entry in (Path.cwd() / environ["PATH_INFO"][1:]).glob("*"):
-        if entry.name.startswith("."):
-            continue
-        rel_path = entry.relative_to(Path.cwd())
-        page += '<p><a href="/static/{0}">{1}</a></p>'.format(rel_path, entry.name)
-    page += INDEX_TEMPLATE_FOOT
-    content = page.encode("utf-8")
+    directory = Path.cwd() / environ["PATH_INFO"][1:]
+    rel_dir = directory.relative_to(Path.cwd())
+    names = directory_names(directory)
+    page = page_number(environ)
+    start = (page - 1) * INDEX_PAGE_SIZE
+    stop = start + INDEX_PAGE_SIZE
+    lines = [INDEX_TEMPLATE_HEAD.format(environ.get("PATH_INFO", "."))]
+    lines.extend(
+        INDEX_TEMPLATE_ENTRY.format(rel_dir / name, name) for name in names[start:stop]
+    )
+    if page > 1:
+        lines.append(INDEX_TEMPLATE_NAV.format(page - 1, "Previous"))
+    if stop < len(names):
+        lines.append(INDEX_TEMPLATE_NAV.format(page + 1, "Next"))
+    lines.append(INDEX_TEMPLATE_FOOT)
+    content = "".join(lines).encode("utf-8")
     headers = [
         ("Content-Type", 'text/html; charset="utf-8"'),
         ("Content-Length", str(len(content))),
@@ -204,9 +260,148 @@ def routing(
     return content
 
 
-def server_demo() -> None:
-    httpd = make_server("", 8080, routing)
-    print("Serving HTTP on port 8080...")
+from collections.abc import Callable
+from functools import lru_cache
+import gzip
+
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": lambda content: gzip.compress(content, compresslevel=6, mtime=0),
+}
+
+try:
+    import brotli  # type: ignore[import]
+
+    COMPRESSORS["br"] = brotli.compress
+except ImportError:  # pragma: no cover
+    pass
+
+try:
+    import zstandard  # type: ignore[import]
+
+    COMPRESSORS["zstd"] = zstandard.ZstdCompressor().compress
+except ImportError:  # pragma: no cover
+    pass
+
+ENCODING_PREFERENCE = ["zstd", "br", "gzip"]
+
+COMPRESSIBLE_TYPES = {"application/json", "application/xml", "text/csv"}
+
+COMPRESS_MIN_SIZE = 500
+
+COMPRESS_CACHE_LIMIT = 64 * 1024
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """
+    The best available encoding from an Accept-Encoding header, or None.
+
+    >>> choose_encoding("gzip, deflate")
+    'gzip'
+    >>> choose_encoding("gzip;q=0, identity") is None
+    True
+    >>> choose_encoding("*") in COMPRESSORS
+    True
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q_text = params.strip().removeprefix("q=") if params else "1"
+        try:
+            weights[name.strip().lower()] = float(q_text)
+        except ValueError:
+            continue
+    candidates = [
+        (weights.get(encoding, weights.get("*", 0.0)), -rank, encoding)
+        for rank, encoding in enumerate(ENCODING_PREFERENCE)
+        if encoding in COMPRESSORS
+    ]
+    q, _, encoding = max(candidates)
+    return encoding if q > 0 else None
+
+
+def compressible(content_type: str) -> bool:
+    mime_type = content_type.partition(";")[0].strip().lower()
+    return mime_type.startswith("text/") or mime_type in COMPRESSIBLE_TYPES
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    return COMPRESSORS[encoding](content)
+
+
+@lru_cache(maxsize=256)
+def compress_small(content: bytes, encoding: str) -> bytes:
+    """
+    Compressed content, cached, keyed on the content itself.
+    Only use this for small bodies: the cache holds both the raw and
+    the compressed bytes, and every lookup hashes the whole body.
+    """
+    return compress(content, encoding)
+
+
+def compression_middleware(
+    app: "WSGIApplication",
+    minimum_size: int = COMPRESS_MIN_SIZE,
+    cache_limit: int = COMPRESS_CACHE_LIMIT,
+) -> "WSGIApplication":
+    """
+    Wraps a WSGI app to honor the request's Accept-Encoding.
+    Bodies up to ``cache_limit`` bytes have their compressed form cached;
+    larger bodies are compressed for each request.
+    """
+
+    def compressing_app(
+        environ: "WSGIEnvironment", start_response: "StartResponse"
+    ) -> Iterable[bytes]:
+        encoding = choose_encoding(environ.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return app(environ, start_response)
+
+        captured: list[tuple[str, list[tuple[str, str]]]] = []
+        written: list[bytes] = []
+
+        def capture(
+            status: str,
+            headers: list[tuple[str, str]],
+            exc_info: "OptExcInfo | None" = None,
+        ) -> Callable[[bytes], object]:
+            captured.append((status, headers))
+            return written.append
+
+        result = app(environ, capture)
+        try:
+            content = b"".join(written) + b"".join(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+        status, headers = captured[-1]
+        header_map = {name.lower(): value for name, value in headers}
+        if (
+            len(content) >= minimum_size
+            and compressible(header_map.get("content-type", ""))
+            and "content-encoding" not in header_map
+        ):
+            if len(content) <= cache_limit:
+                content = compress_small(content, encoding)
+            else:
+                content = compress(content, encoding)
+            headers = [
+                (name, value)
+                for name, value in headers
+                if name.lower() != "content-length"
+            ] + [
+                ("Content-Encoding", encoding),
+                ("Content-Length", str(len(content))),
+                ("Vary", "Accept-Encoding"),
+            ]
+        start_response(status, headers)
+        return [content]
+
+    return compressing_app
+
+
+def server_demo(port: int = 8080) -> None:
+    httpd = make_server("", port, compression_middleware(routing))
+    print(f"Serving HTTP on port {port}...")
 
     # Respond to requests until process is killed
     httpd.serve_forever()
@@ -226,27 +421,110 @@ import pytest
 
 
 @pytest.mark.server_file("Chapter15/ch15_ex3.py")
-def test_server(running_server: Path) -> None:
+def test_server(running_server: "RunningServer") -> None:
     # demo app part of WSGI ref
-    status, body = urllib_get("http://localhost:8080/demo/some/path/to/data")
+    status, body = urllib_get(f"{running_server.url}/demo/some/path/to/data")
     assert status == 200
     print(body)
 
     # static
-    status, body = urllib_get("http://localhost:8080/static/Chapter15/demo.file")
+    status, body = urllib_get(f"{running_server.url}/static/Chapter15/demo.file")
     assert status == 200
     assert body == (Path.cwd() / "Chapter15" / "demo.file").read_text()
 
     # static/index
-    status, body = urllib_get("http://localhost:8080/static/")
+    status, body = urllib_get(f"{running_server.url}/static/")
     assert status == 200
     assert "<h1>Files in /</h1>" in body
 
     # welcome
-    status, body = urllib_get("http://localhost:8080/welcome/")
+    status, body = urllib_get(f"{running_server.url}/welcome/")
     assert status == 200
     assert body == WELCOME_TEMPLATE
 
 
+import io
+from unittest.mock import Mock
+
+
+def test_index_app_pages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for n in range(5):
+        (tmp_path / f"file_{n}.txt").write_text("")
+    (tmp_path / ".hidden").write_text("")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys.modules[__name__], "INDEX_PAGE_SIZE", 2)
+    start_response = Mock()
+
+    def get(query: str) -> str:
+        environ = {
+            "PATH_INFO": "/",
+            "QUERY_STRING": query,
+            "wsgi.errors": io.StringIO(),
+        }
+        content = b"".join(index_app(environ, start_response))
+        return content.decode("utf-8")
+
+    page_1 = get("")
+    assert '<a href="/static/file_0.txt">file_0.txt</a>' in page_1
+    assert "file_2.txt" not in page_1
+    assert '<a href="?page=2">Next</a>' in page_1
+    page_3 = get("page=3")
+    assert '<a href="/static/file_4.txt">file_4.txt</a>' in page_3
+    assert '<a href="?page=2">Previous</a>' in page_3
+    assert "Next" not in page_3
+    assert ".hidden" not in page_1 + page_3
+
+    # Directory mtime changes invalidate the cached listing
+    (tmp_path / "file_5.txt").write_text("")
+    os.utime(tmp_path, ns=(0, INDEX_CACHE[tmp_path].mtime_ns + 1))
+    assert "file_5.txt" in get("page=3")
+
+
+def test_compression_middleware() -> None:
+    app = compression_middleware(welcome_app)
+    start_response = Mock()
+    environ = {"HTTP_ACCEPT_ENCODING": "gzip;q=1.0, identity;q=0.5"}
+    content = b"".join(app(environ, start_response))
+    status, headers = start_response.call_args.args
+    assert status == "200 OK"
+    assert ("Content-Encoding", "gzip") in headers
+    assert ("Content-Length", str(len(content))) in headers
+    assert gzip.decompress(content) == WELCOME_TEMPLATE.encode("utf-8")
+    assert b"".join(app(environ, start_response)) is content
+
+    plain = b"".join(app({"HTTP_ACCEPT_ENCODING": "identity"}, start_response))
+    assert plain == WELCOME_TEMPLATE.encode("utf-8")
+    status, headers = start_response.call_args.args
+    assert "Content-Encoding" not in dict(headers)
+
+    small = compression_middleware(welcome_app, minimum_size=10_000)
+    content = b"".join(small(environ, start_response))
+    assert content == WELCOME_TEMPLATE.encode("utf-8")
+
+    compress_small.cache_clear()
+    uncached = compression_middleware(welcome_app, cache_limit=100)
+    content = b"".join(uncached(environ, start_response))
+    assert gzip.decompress(content) == WELCOME_TEMPLATE.encode("utf-8")
+    assert compress_small.cache_info().currsize == 0
+
+
+from Chapter15.ch15_ex1 import ConnectionPool
+
+
+@pytest.mark.server_file("Chapter15/ch15_ex3.py")
+def test_server_pool(running_server: "RunningServer") -> None:
+    urls = [
+        f"{running_server.url}/static/Chapter15/demo.file",
+        f"{running_server.url}/welcome/",
+        f"{running_server.url}/static/",
+    ]
+    with ConnectionPool(max_per_host=2) as pool:
+        (s_1, demo), (s_2, welcome), (s_3, index) = pool.get_many(urls)
+    assert s_1 == s_2 == s_3 == 200
+    assert demo == (Path.cwd() / "Chapter15" / "demo.file").read_text()
+    assert welcome == WELCOME_TEMPLATE
+    assert "<h1>Files in /</h1>" in index
+
+
 if __name__ == "__main__":
-    server_demo()
+    server_demo(int(sys.argv[1]) if len(sys.argv) > 1 else 8080)
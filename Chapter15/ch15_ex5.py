@@ -286,59 +286,252 @@ def format() -> str:
 from flask import request, abort, make_response, Response
 
 
+import hashlib
+import yaml
+from os import environ
+
+app.config["OPENAPI_PATH"] = Path(environ.get("CH15_OPENAPIPATH", ".")) / "openapi.yaml"
+
+SCHEMA_TYPES: dict[str, Callable[[str], Any]] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+}
+
+
+class Parameter(NamedTuple):
+    """An OpenAPI parameter, compiled for validating request values."""
+
+    name: str
+    location: str
+    required: bool
+    kind: Callable[[str], Any]
+    choices: frozenset[str] | None
+
+    @classmethod
+    def create(cls: type["Parameter"], source: dict[str, Any]) -> "Parameter":
+        schema = source.get("schema", {})
+        return Parameter(
+            source["name"],
+            source["in"],
+            source.get("required", False),
+            SCHEMA_TYPES.get(schema.get("type", "string"), str),
+            frozenset(map(str, schema["enum"])) if "enum" in schema else None,
+        )
+
+    def problem(self, value: str | None) -> str | None:
+        if value is None:
+            if self.required:
+                return f"Missing {self.location} parameter {self.name!r}"
+            return None
+        if self.choices is not None and value not in self.choices:
+            return f"Invalid {self.name}={value!r}"
+        try:
+            self.kind(value)
+        except ValueError:
+            return f"Invalid {self.name}={value!r}"
+        return None
+
+
+class OpenAPIDocument(NamedTuple):
+    """The parsed spec, its JSON serialization, and compiled parameters."""
+
+    mtime_ns: int
+    spec: dict[str, Any]
+    content: bytes
+    etag: str
+    operations: dict[str, list[Parameter]]
+
+    @classmethod
+    def create(
+        cls: type["OpenAPIDocument"], mtime_ns: int, spec: dict[str, Any]
+    ) -> "OpenAPIDocument":
+        content = json.dumps(spec, sort_keys=True).encode("utf-8")
+        operations = {
+            operation["operationId"]: list(
+                map(Parameter.create, operation.get("parameters", []))
+            )
+            for path_item in spec["paths"].values()
+            for operation in path_item.values()
+            if "operationId" in operation
+        }
+        etag = hashlib.sha256(content).hexdigest()[:32]
+        return OpenAPIDocument(mtime_ns, spec, content, etag, operations)
+
+
+OPENAPI_CACHE: dict[Path, OpenAPIDocument] = {}
+
+
+def load_openapi(spec_path: Path) -> OpenAPIDocument:
+    """The OpenAPI document, parsed only when the file's mtime changes."""
+    mtime_ns = spec_path.stat().st_mtime_ns
+    document = OPENAPI_CACHE.get(spec_path)
+    if document is None or document.mtime_ns != mtime_ns:
+        with spec_path.open() as source:
+            spec = yaml.load(source, Loader=yaml.SafeLoader)
+        document = OpenAPIDocument.create(mtime_ns, spec)
+        OPENAPI_CACHE[spec_path] = document
+    return document
+
+
+def openapi_operation(
+    operation_id: str, **view_arg_names: str
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """
+    Validates a view's parameters against the spec's ``operation_id``.
+    ``view_arg_names`` maps spec path parameter names to view argument names.
+    """
+
+    def decorator(view: Callable[P, T]) -> Callable[P, T]:
+        @wraps(view)
+        def validated(*args: P.args, **kwargs: P.kwargs) -> T:
+            document = load_openapi(app.config["OPENAPI_PATH"])
+            for parameter in document.operations[operation_id]:
+                if parameter.location == "path":
+                    name = view_arg_names.get(parameter.name, parameter.name)
+                    value = cast(str | None, kwargs.get(name))
+                else:
+                    value = request.args.get(parameter.name)
+                if problem := parameter.problem(value):
+                    abort(400, problem)
+            return view(*args, **kwargs)
+
+        return validated
+
+    return decorator
+
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
+def cached_content(
+    source_path: Path, mtime_ns: int, series_id: str | None, response_format: str
+) -> bytes:
+    """
+    Serialized bytes of the index (``series_id`` of None) or of one series.
+    The source file's ``mtime_ns`` is part of the key so edits aren't served stale.
+    """
+    data = get_series_map(source_path)
+    if series_id is None:
+        index_listofdicts = [{"Series": k} for k in data.keys()]
+        return serialize(
+            response_format, index_listofdicts, document_tag="Index", row_tag="Series"
+        )
+    dataset = anscombe_filter(series_id, data)._as_listofdicts()
+    return serialize(response_format, dataset, document_tag="Series", row_tag="Pair")
+
+
+@lru_cache(maxsize=128)
+def cached_compressed_content(
+    source_path: Path,
+    mtime_ns: int,
+    series_id: str | None,
+    response_format: str,
+    encoding: str,
+) -> bytes:
+    """
+    Compressed bytes of :func:`cached_content`, cached with the same key
+    plus the encoding. The key is small, so a lookup doesn't hash the body.
+    """
+    return compress(
+        cached_content(source_path, mtime_ns, series_id, response_format), encoding
+    )
+
+
+ContentKey: TypeAlias = tuple[Path, int, str | None, str]
+
+
+def content_key(series_id: str | None, response_format: str) -> ContentKey:
+    source_path = app.config["FILE_PATH"]
+    return source_path, source_path.stat().st_mtime_ns, series_id, response_format
+
+
+def content(series_id: str | None, response_format: str) -> bytes:
+    return cached_content(*content_key(series_id, response_format))
+
+
+class ContentResponse(Response):
+    """
+    A response with cached content. It carries the cache key,
+    so :func:`compress_response` can use the cached compressed content.
+    """
+
+    content_key: ContentKey | None = None
+
+
+def content_response(series_id: str | None, response_format: str) -> ContentResponse:
+    key = content_key(series_id, response_format)
+    response = ContentResponse(
+        cached_content(*key), 200, {"Content-Type": response_format}
+    )
+    response.content_key = key
+    return response
+
+
 @app.route("/anscombe/")
+@openapi_operation("getIDs")
 def index_view() -> Response:
     # 1. Validate
     response_format = format()
-    # 2. Get data
-    data = get_series_map(app.config["FILE_PATH"])
-    index_listofdicts = [{"Series": k} for k in data.keys()]
-    # 3. Prepare Response
-    try:
-        content_bytes = serialize(
-            response_format, index_listofdicts, document_tag="Index", row_tag="Series"
-        )
-        response = make_response(content_bytes, 200, {"Content-Type": response_format})
-        return response
-    except KeyError:
-        abort(404, f"Unknown {response_format=}")
+    # 2. Get data and 3. Prepare Response
+    return content_response(None, response_format)
 
 
 @app.route("/anscombe/<series_id>")
+@openapi_operation("getData", series="series_id")
 def series_view(series_id: str, form: str | None = None) -> Response:
     # 1. Validate
     response_format = format()
-    # 2. Get data (and validate some more)
-    data = get_series_map(app.config["FILE_PATH"])
+    # 2. Get data (and validate some more) and 3. Prepare Response
     try:
-        dataset = anscombe_filter(series_id, data)._as_listofdicts()
+        return content_response(series_id, response_format)
     except KeyError:
         abort(404, "Unknown Series")
-    # 3. Prepare Response
-    try:
-        content_bytes = serialize(
-            response_format, dataset, document_tag="Series", row_tag="Pair"
-        )
-        response = make_response(content_bytes, 200, {"Content-Type": response_format})
+
+
+from Chapter15.ch15_ex3 import choose_encoding, compressible, compress
+
+app.config["COMPRESS_MIN_SIZE"] = 500
+
+
+@app.after_request
+def compress_response(response: Response) -> Response:
+    """Compresses the response body if the client's Accept-Encoding permits."""
+    encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+    if (
+        encoding is None
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or not compressible(response.content_type or "")
+    ):
         return response
-    except KeyError:
-        abort(404, f"Unknown {response_format=}")
+    content_bytes = response.get_data()
+    if len(content_bytes) < app.config["COMPRESS_MIN_SIZE"]:
+        return response
+    if isinstance(response, ContentResponse) and response.content_key:
+        response.set_data(cached_compressed_content(*response.content_key, encoding))
+    else:
+        response.set_data(compress(content_bytes, encoding))
+    response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
 
 
-import yaml
-from flask import jsonify
 from flask.testing import FlaskClient
 from collections.abc import Iterator
-from os import environ
 
 
 @app.route("/openapi.json")
 def openapi_view() -> Response:
-    with (
-        Path(environ.get('CH15_OPENAPIPATH', '.')) / "openapi.yaml"
-    ).open() as source:
-        spec = yaml.load(source, Loader=yaml.SafeLoader)
-    return jsonify(spec)
+    document = load_openapi(app.config["OPENAPI_PATH"])
+    response = make_response(
+        document.content, 200, {"Content-Type": "application/json"}
+    )
+    # Weak: compress_response() may send this with a different content-coding.
+    response.set_etag(document.etag, weak=True)
+    response.make_conditional(request)
+    return response
 
 
 @pytest.fixture()
@@ -405,7 +598,85 @@ def test_openapi(app_client: FlaskClient) -> None:
     assert response.json["info"]["version"] == "1.0.0"  # type: ignore[index]
 
 
+def test_openapi_etag(app_client: FlaskClient) -> None:
+    response = app_client.get("/openapi.json")
+    etag = response.headers["ETag"]
+    response_2 = app_client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response_2.status_code == 304
+    assert response_2.data == b""
+    assert etag.startswith('W/"')
+    gzipped = app_client.get(
+        "/openapi.json", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert gzipped.status_code == 304
+
+
+def test_openapi_reload(
+    app_client: FlaskClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec_path = tmp_path / "openapi.yaml"
+    spec_path.write_text((app.config["OPENAPI_PATH"]).read_text())
+    monkeypatch.setitem(app.config, "OPENAPI_PATH", spec_path)
+    document = load_openapi(spec_path)
+    assert load_openapi(spec_path) is document
+    spec_path.write_text(spec_path.read_text().replace("1.0.0", "1.0.1"))
+    os.utime(spec_path, ns=(0, document.mtime_ns + 1))
+    response = app_client.get("/openapi.json")
+    assert response.json["info"]["version"] == "1.0.1"  # type: ignore[index]
+
+
+def test_validation(app_client: FlaskClient) -> None:
+    assert app_client.get("/anscombe/I?form=csv").status_code == 200
+    assert app_client.get("/anscombe/V").status_code == 400
+    assert app_client.get("/anscombe/I?form=yaml").status_code == 400
+    assert app_client.get("/anscombe/?form=json").status_code == 200
+    assert app_client.get("/anscombe/?form=text").status_code == 400
+
+
+import os
+import gzip
+
+
+def test_compressed_response(app_client: FlaskClient) -> None:
+    response = app_client.get("/anscombe/I", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    plain = app_client.get("/anscombe/I")
+    assert "Content-Encoding" not in plain.headers
+    assert gzip.decompress(response.data) == plain.data
+
+    small = app_client.get(
+        "/anscombe/I",
+        headers={"Accept-Encoding": "gzip", "Accept": "application/json"},
+    )
+    assert "Content-Encoding" not in small.headers
+
+
+def test_cached_content(app_client: FlaskClient) -> None:
+    assert content("I", "text/csv") is content("I", "text/csv")
+    with pytest.raises(KeyError):
+        content("V", "text/csv")
+    cached_compressed_content.cache_clear()
+    for _ in range(2):
+        response = app_client.get("/anscombe/I", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+    assert cached_compressed_content.cache_info().hits == 1
+
+
+def test_compressed_content_per_response(app_client: FlaskClient) -> None:
+    """An outer app context must not leak one response's cache key into another."""
+    with app.app_context():
+        series = app_client.get("/anscombe/I?form=json")
+        assert series.status_code == 200
+        response = app_client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        document = json.loads(gzip.decompress(response.data))
+        assert document["info"]["title"] == "Anscombe Server"
+
+
 __test__ = {name: value for name, value in globals().items() if name.startswith("REPL")}
 
 if __name__ == "__main__":
+    load_openapi(app.config["OPENAPI_PATH"])
     app.run(debug=True)
@@ -4,41 +4,126 @@ Chapter 15, Test Configuration
 """
 from collections.abc import Iterator
 from pathlib import Path
+import socket
 import subprocess
+import sys
 import time
+from typing import NamedTuple
 
 import pytest
 
+
 def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line(
         "markers", "server_file(file): mark test to use a specific file"
     )
 
-@pytest.fixture
-def running_server(request: pytest.FixtureRequest) -> Iterator[Path]:
+
+def free_port() -> int:
+    """An ephemeral port number the OS isn't currently using."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("localhost", 0))
+        port: int = probe.getsockname()[1]
+    return port
+
+
+class RunningServer(NamedTuple):
+    url: str
+    port: int
+    log_path: Path
+    process: "subprocess.Popen[str]"
+
+    def wait_until_ready(self, timeout: float = 10.0, interval: float = 0.02) -> None:
+        """Polls the port until the server accepts connections."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if (status := self.process.poll()) is not None:
+                raise RuntimeError(
+                    f"Server exited with {status}:\n{self.log_path.read_text()}"
+                )
+            try:
+                with socket.create_connection(
+                    ("localhost", self.port), timeout=interval
+                ):
+                    return
+            except OSError:
+                time.sleep(interval)
+        raise TimeoutError(f"Server not ready on port {self.port} after {timeout}s")
+
+
+class ServerPool:
     """
-    Runs the named module as a WSGI server.
-    Ideally, this is scope="module"
+    Runs each named module as a server, once, on its own ephemeral port.
+    The server gets the port number as its command-line argument.
     """
-    server_file = request.node.get_closest_marker("server_file").args[0]
-
-    log_path = Path.cwd() / "server.log"
-    with log_path.open("w") as log_file:
-        log_file.write(f"Starting server {server_file!r}...\n")
-        with subprocess.Popen(
-            ["python", server_file],
-            stdout=log_file,
-            stderr=subprocess.STDOUT,
-            text=True
-        ) as server:
-            time.sleep(1)  # Allow child to start
-            log_file.write(f"Startup Failure? {server.poll()=}\n")
-            log_file.flush()
 
-            yield log_path  # Wait while tests run
+    def __init__(self, log_dir: Path) -> None:
+        self.log_dir = log_dir
+        self.servers: dict[str, RunningServer] = {}
 
-            log_file.write(f"Killing {server.pid=}\n")
-            server.kill()
-            time.sleep(0.5)  # Allow child to finish
-            log_file.write(f"Final {server.poll()=}\n")
+    def _spawn(self, server_file: str) -> RunningServer:
+        port = free_port()
+        log_path = self.log_dir / f"{Path(server_file).stem}.log"
+        with log_path.open("w") as log_file:
+            log_file.write(f"Starting server {server_file!r} on {port}...\n")
             log_file.flush()
+            process = subprocess.Popen(
+                [sys.executable, server_file, str(port)],
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+        return RunningServer(f"http://localhost:{port}", port, log_path, process)
+
+    def start(self, *server_files: str) -> None:
+        """Spawns all the servers first, so they start up concurrently."""
+        spawned = [
+            (server_file, self._spawn(server_file))
+            for server_file in server_files
+            if server_file not in self.servers
+        ]
+        self.servers.update(spawned)
+        for _, server in spawned:
+            server.wait_until_ready()
+
+    def get(self, server_file: str) -> RunningServer:
+        self.start(server_file)
+        return self.servers[server_file]
+
+    def stop(self) -> None:
+        for server in self.servers.values():
+            server.process.kill()
+        for server in self.servers.values():
+            server.process.wait(timeout=5)
+        self.servers.clear()
+
+
+@pytest.fixture(scope="session")
+def server_pool(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Iterator[ServerPool]:
+    """Starts every server named by a collected test's marker, in parallel."""
+    pool = ServerPool(tmp_path_factory.mktemp("servers"))
+    server_files = {
+        marker.args[0]
+        for item in request.session.items
+        for marker in item.iter_markers("server_file")
+    }
+    try:
+        pool.start(*sorted(server_files))
+        yield pool
+    finally:
+        pool.stop()
+
+
+@pytest.fixture
+def running_server(
+    request: pytest.FixtureRequest, server_pool: ServerPool
+) -> RunningServer:
+    """
+    The server for the test's ``server_file`` marker,
+    shared by all tests in the session.
+    """
+    marker = request.node.get_closest_marker("server_file")
+    assert marker is not None, "running_server requires a server_file marker"
+    return server_pool.get(marker.args[0])
@@ -0,0 +1,1030 @@
+"""Functional Python Programming 3e
+
+Chapter 16, χ² critical values
+
+Generated by ch16_ex3.write_critical_values(). Do not edit.
+"""
+
+from array import array
+
+ALPHAS = (0.1, 0.05, 0.025, 0.01, 0.005, 0.001)
+K_MAX = 1000
+
+# fmt: off
+CRITICAL_VALUES = {
+    0.1: array("d", [
+        2.705543, 4.605170, 6.251389, 7.779440, 9.236357, 10.644641,
+        12.017037, 13.361566, 14.683657, 15.987179, 17.275009, 18.549348,
+        19.811929, 21.064144, 22.307130, 23.541829, 24.769035, 25.989423,
+        27.203571, 28.411981, 29.615089, 30.813282, 32.006900, 33.196244,
+        34.381587, 35.563171, 36.741217, 37.915923, 39.087470, 40.256024,
+        41.421736, 42.584745, 43.745180, 44.903158, 46.058788, 47.212174,
+        48.363408, 49.512580, 50.659770, 51.805057, 52.948512, 54.090202,
+        55.230192, 56.368541, 57.505305, 58.640537, 59.774289, 60.906607,
+        62.037537, 63.167121, 64.295400, 65.422413, 66.548197, 67.672786,
+        68.796214, 69.918513, 71.039713, 72.159844, 73.278932, 74.397006,
+        75.514089, 76.630208, 77.745385, 78.859642, 79.973003, 81.085486,
+        82.197113, 83.307902, 84.417873, 85.527043, 86.635429, 87.743048,
+        88.849916, 89.956048, 91.061460, 92.166166, 93.270180, 94.373516,
+        95.476186, 96.578204, 97.679581, 98.780329, 99.880461, 100.979987,
+        102.078918, 103.177265, 104.275037, 105.372246, 106.468900, 107.565009,
+        108.660581, 109.755627, 110.850154, 111.944171, 113.037686, 114.130707,
+        115.223242, 116.315298, 117.406883, 118.498004, 119.588667, 120.678880,
+        121.768650, 122.857982, 123.946883, 125.035359, 126.123417, 127.211062,
+        128.298300, 129.385136, 130.471576, 131.557626, 132.643290, 133.728575,
+        134.813484, 135.898022, 136.982196, 138.066008, 139.149464, 140.232569,
+        141.315326, 142.397741, 143.479816, 144.561557, 145.642968, 146.724052,
+        147.804813, 148.885255, 149.965383, 151.045199, 152.124707, 153.203911,
+        154.282814, 155.361420, 156.439731, 157.517752, 158.595485, 159.672934,
+        160.750102, 161.826991, 162.903605, 163.979946, 165.056018, 166.131824,
+        167.207366, 168.282646, 169.357668, 170.432435, 171.506948, 172.581210,
+        173.655225, 174.728993, 175.802519, 176.875803, 177.948850, 179.021660,
+        180.094236, 181.166580, 182.238695, 183.310583, 184.382246, 185.453686,
+        186.524904, 187.595904, 188.666687, 189.737255, 190.807609, 191.877753,
+        192.947688, 194.017415, 195.086937, 196.156255, 197.225371, 198.294287,
+        199.363004, 200.431525, 201.499851, 202.567983, 203.635924, 204.703675,
+        205.771236, 206.838611, 207.905801, 208.972806, 210.039630, 211.106272,
+        212.172734, 213.239019, 214.305127, 215.371060, 216.436819, 217.502405,
+        218.567821, 219.633067, 220.698144, 221.763054, 222.827798, 223.892378,
+        224.956794, 226.021048, 227.085141, 228.149074, 229.212849, 230.276467,
+        231.339928, 232.403234, 233.466387, 234.529386, 235.592234, 236.654931,
+        237.717479, 238.779879, 239.842130, 240.904236, 241.966196, 243.028012,
+        244.089685, 245.151215, 246.212604, 247.273852, 248.334961, 249.395932,
+        250.456765, 251.517461, 252.578022, 253.638448, 254.698740, 255.758899,
+        256.818926, 257.878821, 258.938587, 259.998222, 261.057729, 262.117108,
+        263.176360, 264.235486, 265.294487, 266.353362, 267.412114, 268.470743,
+        269.529249, 270.587634, 271.645898, 272.704042, 273.762067, 274.819973,
+        275.877761, 276.935432, 277.992986, 279.050425, 280.107749, 281.164959,
+        282.222054, 283.279037, 284.335908, 285.392667, 286.449315, 287.505852,
+        288.562280, 289.618598, 290.674809, 291.730911, 292.786906, 293.842795,
+        294.898577, 295.954255, 297.009827, 298.065295, 299.120660, 300.175922,
+        301.231081, 302.286138, 303.341094, 304.395949, 305.450704, 306.505359,
+        307.559915, 308.614372, 309.668732, 310.722993, 311.777158, 312.831227,
+        313.885199, 314.939076, 315.992858, 317.046545, 318.100139, 319.153638,
+        320.207045, 321.260360, 322.313582, 323.366713, 324.419753, 325.472702,
+        326.525561, 327.578330, 328.631010, 329.683602, 330.736105, 331.788520,
+        332.840847, 333.893088, 334.945242, 335.997310, 337.049292, 338.101188,
+        339.153000, 340.204728, 341.256371, 342.307931, 343.359407, 344.410801,
+        345.462112, 346.513341, 347.564488, 348.615554, 349.666539, 350.717444,
+        351.768269, 352.819013, 353.869679, 354.920265, 355.970773, 357.021203,
+        358.071554, 359.121828, 360.172025, 361.222145, 362.272189, 363.322156,
+        364.372048, 365.421864, 366.471605, 367.521271, 368.570863, 369.620381,
+        370.669825, 371.719196, 372.768493, 373.817718, 374.866870, 375.915950,
+        376.964959, 378.013896, 379.062761, 380.111556, 381.160280, 382.208934,
+        383.257518, 384.306032, 385.354476, 386.402852, 387.451159, 388.499398,
+        389.547568, 390.595670, 391.643705, 392.691672, 393.739573, 394.787406,
+        395.835173, 396.882874, 397.930509, 398.978078, 400.025582, 401.073020,
+        402.120394, 403.167703, 404.214948, 405.262129, 406.309246, 407.356299,
+        408.403289, 409.450216, 410.497080, 411.543882, 412.590622, 413.637299,
+        414.683914, 415.730468, 416.776961, 417.823393, 418.869764, 419.916074,
+        420.962324, 422.008513, 423.054643, 424.100713, 425.146724, 426.192676,
+        427.238568, 428.284402, 429.330177, 430.375894, 431.421553, 432.467155,
+        433.512698, 434.558184, 435.603613, 436.648985, 437.694300, 438.739559,
+        439.784761, 440.829907, 441.874997, 442.920032, 443.965011, 445.009935,
+        446.054803, 447.099617, 448.144376, 449.189081, 450.233731, 451.278327,
+        452.322869, 453.367357, 454.411792, 455.456174, 456.500503, 457.544778,
+        458.589001, 459.633171, 460.677289, 461.721355, 462.765369, 463.809330,
+        464.853241, 465.897099, 466.940907, 467.984663, 469.028369, 470.072023,
+        471.115628, 472.159181, 473.202685, 474.246138, 475.289542, 476.332896,
+        477.376200, 478.419455, 479.462661, 480.505818, 481.548926, 482.591985,
+        483.634996, 484.677958, 485.720872, 486.763739, 487.806557, 488.849327,
+        489.892050, 490.934726, 491.977354, 493.019936, 494.062470, 495.104957,
+        496.147398, 497.189793, 498.232141, 499.274443, 500.316699, 501.358909,
+        502.401073, 503.443192, 504.485265, 505.527293, 506.569276, 507.611214,
+        508.653108, 509.694956, 510.736760, 511.778519, 512.820235, 513.861906,
+        514.903533, 515.945116, 516.986656, 518.028152, 519.069604, 520.111013,
+        521.152379, 522.193702, 523.234983, 524.276220, 525.317415, 526.358567,
+        527.399677, 528.440744, 529.481770, 530.522754, 531.563695, 532.604595,
+        533.645454, 534.686271, 535.727046, 536.767780, 537.808474, 538.849126,
+        539.889737, 540.930308, 541.970838, 543.011328, 544.051777, 545.092186,
+        546.132555, 547.172884, 548.213173, 549.253423, 550.293632, 551.333802,
+        552.373933, 553.414025, 554.454077, 555.494090, 556.534064, 557.574000,
+        558.613896, 559.653755, 560.693574, 561.733355, 562.773098, 563.812803,
+        564.852470, 565.892098, 566.931689, 567.971243, 569.010758, 570.050236,
+        571.089677, 572.129080, 573.168446, 574.207775, 575.247067, 576.286323,
+        577.325541, 578.364723, 579.403868, 580.442976, 581.482049, 582.521085,
+        583.560085, 584.599048, 585.637976, 586.676868, 587.715724, 588.754545,
+        589.793330, 590.832079, 591.870793, 592.909472, 593.948116, 594.986724,
+        596.025298, 597.063837, 598.102340, 599.140810, 600.179244, 601.217644,
+        602.256010, 603.294341, 604.332638, 605.370901, 606.409129, 607.447324,
+        608.485485, 609.523612, 610.561706, 611.599765, 612.637792, 613.675785,
+        614.713744, 615.751670, 616.789563, 617.827423, 618.865250, 619.903044,
+        620.940806, 621.978534, 623.016230, 624.053893, 625.091524, 626.129122,
+        627.166688, 628.204222, 629.241724, 630.279194, 631.316631, 632.354037,
+        633.391411, 634.428753, 635.466063, 636.503342, 637.540590, 638.577805,
+        639.614990, 640.652143, 641.689266, 642.726357, 643.763417, 644.800446,
+        645.837444, 646.874411, 647.911348, 648.948254, 649.985129, 651.021974,
+        652.058789, 653.095573, 654.132327, 655.169051, 656.205744, 657.242408,
+        658.279042, 659.315645, 660.352219, 661.388763, 662.425278, 663.461763,
+        664.498218, 665.534644, 666.571040, 667.607407, 668.643745, 669.680054,
+        670.716333, 671.752584, 672.788806, 673.824998, 674.861162, 675.897297,
+        676.933404, 677.969481, 679.005531, 680.041551, 681.077544, 682.113508,
+        683.149443, 684.185351, 685.221230, 686.257081, 687.292904, 688.328699,
+        689.364467, 690.400206, 691.435918, 692.471602, 693.507258, 694.542887,
+        695.578488, 696.614062, 697.649609, 698.685128, 699.720620, 700.756085,
+        701.791522, 702.826933, 703.862316, 704.897673, 705.933003, 706.968305,
+        708.003582, 709.038831, 710.074054, 711.109250, 712.144420, 713.179563,
+        714.214680, 715.249770, 716.284834, 717.319872, 718.354884, 719.389870,
+        720.424830, 721.459763, 722.494671, 723.529553, 724.564409, 725.599240,
+        726.634044, 727.668823, 728.703577, 729.738304, 730.773007, 731.807684,
+        732.842336, 733.876962, 734.911563, 735.946139, 736.980690, 738.015215,
+        739.049716, 740.084191, 741.118642, 742.153068, 743.187469, 744.221845,
+        745.256197, 746.290524, 747.324826, 748.359104, 749.393357, 750.427586,
+        751.461790, 752.495971, 753.530126, 754.564258, 755.598365, 756.632449,
+        757.666508, 758.700543, 759.734554, 760.768541, 761.802505, 762.836444,
+        763.870360, 764.904252, 765.938120, 766.971965, 768.005786, 769.039584,
+        770.073358, 771.107108, 772.140836, 773.174540, 774.208220, 775.241878,
+        776.275512, 777.309123, 778.342711, 779.376276, 780.409818, 781.443337,
+        782.476833, 783.510306, 784.543757, 785.577184, 786.610589, 787.643972,
+        788.677331, 789.710668, 790.743983, 791.777275, 792.810544, 793.843792,
+        794.877016, 795.910219, 796.943399, 797.976557, 799.009693, 800.042807,
+        801.075898, 802.108968, 803.142016, 804.175041, 805.208045, 806.241027,
+        807.273987, 808.306925, 809.339842, 810.372737, 811.405610, 812.438461,
+        813.471291, 814.504100, 815.536887, 816.569653, 817.602397, 818.635120,
+        819.667821, 820.700501, 821.733160, 822.765798, 823.798415, 824.831010,
+        825.863585, 826.896138, 827.928671, 828.961182, 829.993673, 831.026143,
+        832.058592, 833.091020, 834.123427, 835.155814, 836.188180, 837.220525,
+        838.252850, 839.285155, 840.317438, 841.349702, 842.381945, 843.414167,
+        844.446369, 845.478551, 846.510713, 847.542854, 848.574975, 849.607076,
+        850.639157, 851.671218, 852.703258, 853.735279, 854.767280, 855.799261,
+        856.831222, 857.863163, 858.895084, 859.926985, 860.958867, 861.990729,
+        863.022571, 864.054394, 865.086197, 866.117980, 867.149744, 868.181489,
+        869.213214, 870.244919, 871.276606, 872.308273, 873.339920, 874.371548,
+        875.403157, 876.434747, 877.466318, 878.497869, 879.529401, 880.560915,
+        881.592409, 882.623884, 883.655340, 884.686778, 885.718196, 886.749596,
+        887.780977, 888.812339, 889.843682, 890.875006, 891.906312, 892.937599,
+        893.968867, 895.000117, 896.031349, 897.062561, 898.093756, 899.124931,
+        900.156089, 901.187228, 902.218348, 903.249451, 904.280534, 905.311600,
+        906.342648, 907.373677, 908.404688, 909.435681, 910.466656, 911.497612,
+        912.528551, 913.559472, 914.590374, 915.621259, 916.652126, 917.682975,
+        918.713806, 919.744619, 920.775415, 921.806192, 922.836952, 923.867694,
+        924.898419, 925.929126, 926.959815, 927.990487, 929.021141, 930.051778,
+        931.082397, 932.112998, 933.143583, 934.174150, 935.204699, 936.235231,
+        937.265746, 938.296243, 939.326724, 940.357187, 941.387633, 942.418061,
+        943.448473, 944.478867, 945.509244, 946.539605, 947.569948, 948.600274,
+        949.630584, 950.660876, 951.691151, 952.721410, 953.751652, 954.781876,
+        955.812085, 956.842276, 957.872450, 958.902608, 959.932749, 960.962874,
+        961.992982, 963.023073, 964.053148, 965.083206, 966.113248, 967.143273,
+        968.173281, 969.203274, 970.233249, 971.263209, 972.293152, 973.323079,
+        974.352989, 975.382883, 976.412761, 977.442623, 978.472468, 979.502297,
+        980.532111, 981.561908, 982.591689, 983.621453, 984.651202, 985.680935,
+        986.710652, 987.740353, 988.770038, 989.799707, 990.829360, 991.858997,
+        992.888618, 993.918224, 994.947814, 995.977388, 997.006946, 998.036489,
+        999.066015, 1000.095527, 1001.125022, 1002.154502, 1003.183967, 1004.213416,
+        1005.242849, 1006.272267, 1007.301669, 1008.331056, 1009.360427, 1010.389783,
+        1011.419124, 1012.448449, 1013.477759, 1014.507053, 1015.536333, 1016.565597,
+        1017.594845, 1018.624079, 1019.653297, 1020.682500, 1021.711688, 1022.740861,
+        1023.770019, 1024.799162, 1025.828289, 1026.857402, 1027.886499, 1028.915582,
+        1029.944650, 1030.973702, 1032.002740, 1033.031763, 1034.060771, 1035.089764,
+        1036.118742, 1037.147706, 1038.176655, 1039.205589, 1040.234508, 1041.263412,
+        1042.292302, 1043.321177, 1044.350038, 1045.378884, 1046.407715, 1047.436532,
+        1048.465334, 1049.494121, 1050.522894, 1051.551653, 1052.580397, 1053.609127,
+        1054.637842, 1055.666543, 1056.695229, 1057.723901,
+    ]),
+    0.05: array("d", [
+        3.841459, 5.991465, 7.814728, 9.487729, 11.070498, 12.591587,
+        14.067140, 15.507313, 16.918978, 18.307038, 19.675138, 21.026070,
+        22.362032, 23.684791, 24.995790, 26.296228, 27.587112, 28.869299,
+        30.143527, 31.410433, 32.670573, 33.924438, 35.172462, 36.415029,
+        37.652484, 38.885139, 40.113272, 41.337138, 42.556968, 43.772972,
+        44.985343, 46.194260, 47.399884, 48.602367, 49.801850, 50.998460,
+        52.192320, 53.383541, 54.572228, 55.758479, 56.942387, 58.124038,
+        59.303512, 60.480887, 61.656233, 62.829620, 64.001112, 65.170769,
+        66.338649, 67.504807, 68.669294, 69.832160, 70.993453, 72.153216,
+        73.311493, 74.468324, 75.623748, 76.777803, 77.930524, 79.081944,
+        80.232098, 81.381015, 82.528727, 83.675261, 84.820645, 85.964907,
+        87.108072, 88.250164, 89.391208, 90.531225, 91.670239, 92.808270,
+        93.945340, 95.081467, 96.216671, 97.350970, 98.484383, 99.616927,
+        100.748619, 101.879474, 103.009509, 104.138738, 105.267177, 106.394840,
+        107.521741, 108.647893, 109.773309, 110.898003, 112.021986, 113.145270,
+        114.267868, 115.389790, 116.511047, 117.631651, 118.751612, 119.870939,
+        120.989644, 122.107735, 123.225221, 124.342113, 125.458419, 126.574148,
+        127.689308, 128.803908, 129.917955, 131.031458, 132.144425, 133.256862,
+        134.368777, 135.480178, 136.591071, 137.701464, 138.811363, 139.920774,
+        141.029704, 142.138160, 143.246147, 144.353672, 145.460740, 146.567358,
+        147.673530, 148.779262, 149.884561, 150.989430, 152.093876, 153.197903,
+        154.301516, 155.404721, 156.507522, 157.609923, 158.711930, 159.813547,
+        160.914778, 162.015628, 163.116101, 164.216201, 165.315932, 166.415299,
+        167.514305, 168.612954, 169.711251, 170.809198, 171.906799, 173.004059,
+        174.100981, 175.197567, 176.293823, 177.389750, 178.485353, 179.580634,
+        180.675597, 181.770246, 182.864582, 183.958610, 185.052332, 186.145751,
+        187.238870, 188.331692, 189.424220, 190.516457, 191.608404, 192.700066,
+        193.791445, 194.882542, 195.973362, 197.063906, 198.154177, 199.244177,
+        200.333909, 201.423375, 202.512577, 203.601519, 204.690201, 205.778627,
+        206.866798, 207.954717, 209.042386, 210.129807, 211.216982, 212.303913,
+        213.390602, 214.477052, 215.563263, 216.649239, 217.734981, 218.820491,
+        219.905770, 220.990822, 222.075646, 223.160247, 224.244624, 225.328780,
+        226.412716, 227.496435, 228.579938, 229.663226, 230.746302, 231.829167,
+        232.911822, 233.994269, 235.076510, 236.158546, 237.240378, 238.322009,
+        239.403439, 240.484671, 241.565705, 242.646544, 243.727187, 244.807638,
+        245.887897, 246.967965, 248.047844, 249.127536, 250.207041, 251.286361,
+        252.365498, 253.444451, 254.523224, 255.601816, 256.680230, 257.758465,
+        258.836525, 259.914409, 260.992120, 262.069657, 263.147023, 264.224218,
+        265.301243, 266.378101, 267.454791, 268.531314, 269.607673, 270.683868,
+        271.759900, 272.835769, 273.911478, 274.987027, 276.062417, 277.137650,
+        278.212725, 279.287644, 280.362409, 281.437019, 282.511477, 283.585782,
+        284.659936, 285.733940, 286.807794, 287.881501, 288.955059, 290.028471,
+        291.101737, 292.174858, 293.247835, 294.320669, 295.393360, 296.465910,
+        297.538319, 298.610588, 299.682719, 300.754710, 301.826565, 302.898282,
+        303.969864, 305.041310, 306.112622, 307.183800, 308.254846, 309.325759,
+        310.396541, 311.467192, 312.537713, 313.608105, 314.678368, 315.748503,
+        316.818512, 317.888393, 318.958149, 320.027780, 321.097286, 322.166669,
+        323.235928, 324.305065, 325.374080, 326.442974, 327.511748, 328.580401,
+        329.648936, 330.717351, 331.785649, 332.853829, 333.921892, 334.989839,
+        336.057670, 337.125386, 338.192988, 339.260476, 340.327850, 341.395112,
+        342.462262, 343.529300, 344.596226, 345.663043, 346.729749, 347.796346,
+        348.862834, 349.929214, 350.995485, 352.061650, 353.127708, 354.193659,
+        355.259504, 356.325245, 357.390880, 358.456412, 359.521839, 360.587163,
+        361.652385, 362.717504, 363.782521, 364.847437, 365.912253, 366.976967,
+        368.041582, 369.106097, 370.170513, 371.234831, 372.299051, 373.363173,
+        374.427197, 375.491125, 376.554957, 377.618692, 378.682332, 379.745878,
+        380.809328, 381.872684, 382.935947, 383.999116, 385.062192, 386.125175,
+        387.188067, 388.250867, 389.313575, 390.376192, 391.438719, 392.501156,
+        393.563503, 394.625760, 395.687929, 396.750009, 397.812000, 398.873904,
+        399.935720, 400.997450, 402.059092, 403.120648, 404.182118, 405.243502,
+        406.304801, 407.366015, 408.427145, 409.488190, 410.549151, 411.610029,
+        412.670823, 413.731535, 414.792164, 415.852711, 416.913176, 417.973559,
+        419.033862, 420.094083, 421.154224, 422.214284, 423.274265, 424.334166,
+        425.393988, 426.453731, 427.513395, 428.572980, 429.632488, 430.691918,
+        431.751271, 432.810546, 433.869745, 434.928867, 435.987913, 437.046882,
+        438.105777, 439.164596, 440.223339, 441.282008, 442.340603, 443.399123,
+        444.457570, 445.515942, 446.574242, 447.632468, 448.690621, 449.748702,
+        450.806711, 451.864647, 452.922512, 453.980305, 455.038027, 456.095679,
+        457.153259, 458.210769, 459.268209, 460.325579, 461.382879, 462.440110,
+        463.497272, 464.554365, 465.611389, 466.668344, 467.725232, 468.782052,
+        469.838804, 470.895488, 471.952105, 473.008656, 474.065139, 475.121556,
+        476.177907, 477.234192, 478.290411, 479.346565, 480.402653, 481.458676,
+        482.514634, 483.570528, 484.626357, 485.682122, 486.737823, 487.793460,
+        488.849033, 489.904544, 490.959991, 492.015375, 493.070697, 494.125956,
+        495.181153, 496.236287, 497.291360, 498.346372, 499.401322, 500.456210,
+        501.511038, 502.565805, 503.620511, 504.675157, 505.729742, 506.784268,
+        507.838733, 508.893140, 509.947486, 511.001774, 512.056002, 513.110172,
+        514.164283, 515.218335, 516.272329, 517.326265, 518.380143, 519.433964,
+        520.487727, 521.541432, 522.595081, 523.648672, 524.702207, 525.755685,
+        526.809107, 527.862472, 528.915781, 529.969035, 531.022232, 532.075374,
+        533.128461, 534.181492, 535.234469, 536.287390, 537.340257, 538.393069,
+        539.445827, 540.498531, 541.551181, 542.603777, 543.656319, 544.708807,
+        545.761243, 546.813625, 547.865954, 548.918230, 549.970453, 551.022624,
+        552.074743, 553.126809, 554.178823, 555.230785, 556.282696, 557.334554,
+        558.386362, 559.438118, 560.489822, 561.541476, 562.593079, 563.644631,
+        564.696133, 565.747584, 566.798985, 567.850336, 568.901637, 569.952888,
+        571.004089, 572.055241, 573.106344, 574.157397, 575.208401, 576.259356,
+        577.310262, 578.361120, 579.411929, 580.462689, 581.513402, 582.564066,
+        583.614682, 584.665250, 585.715771, 586.766244, 587.816670, 588.867048,
+        589.917379, 590.967663, 592.017900, 593.068090, 594.118234, 595.168331,
+        596.218381, 597.268386, 598.318344, 599.368256, 600.418122, 601.467943,
+        602.517718, 603.567447, 604.617131, 605.666770, 606.716363, 607.765912,
+        608.815416, 609.864874, 610.914289, 611.963658, 613.012984, 614.062264,
+        615.111501, 616.160694, 617.209843, 618.258948, 619.308009, 620.357027,
+        621.406001, 622.454932, 623.503819, 624.552664, 625.601465, 626.650223,
+        627.698939, 628.747612, 629.796243, 630.844831, 631.893377, 632.941880,
+        633.990341, 635.038761, 636.087138, 637.135474, 638.183768, 639.232020,
+        640.280231, 641.328401, 642.376529, 643.424616, 644.472662, 645.520667,
+        646.568632, 647.616555, 648.664438, 649.712280, 650.760082, 651.807844,
+        652.855566, 653.903247, 654.950888, 655.998490, 657.046051, 658.093573,
+        659.141055, 660.188498, 661.235901, 662.283265, 663.330590, 664.377876,
+        665.425122, 666.472330, 667.519499, 668.566629, 669.613721, 670.660773,
+        671.707788, 672.754764, 673.801702, 674.848601, 675.895463, 676.942287,
+        677.989072, 679.035820, 680.082530, 681.129203, 682.175838, 683.222435,
+        684.268995, 685.315518, 686.362004, 687.408453, 688.454864, 689.501239,
+        690.547577, 691.593878, 692.640143, 693.686371, 694.732563, 695.778718,
+        696.824837, 697.870919, 698.916966, 699.962976, 701.008951, 702.054889,
+        703.100792, 704.146659, 705.192491, 706.238287, 707.284047, 708.329773,
+        709.375462, 710.421117, 711.466737, 712.512321, 713.557871, 714.603385,
+        715.648865, 716.694310, 717.739720, 718.785096, 719.830438, 720.875744,
+        721.921017, 722.966255, 724.011460, 725.056630, 726.101766, 727.146868,
+        728.191936, 729.236970, 730.281971, 731.326938, 732.371871, 733.416771,
+        734.461638, 735.506471, 736.551271, 737.596038, 738.640771, 739.685472,
+        740.730140, 741.774774, 742.819376, 743.863945, 744.908482, 745.952986,
+        746.997457, 748.041896, 749.086302, 750.130676, 751.175018, 752.219327,
+        753.263605, 754.307850, 755.352064, 756.396245, 757.440395, 758.484513,
+        759.528599, 760.572654, 761.616677, 762.660668, 763.704628, 764.748557,
+        765.792454, 766.836321, 767.880156, 768.923960, 769.967732, 771.011474,
+        772.055185, 773.098866, 774.142515, 775.186134, 776.229722, 777.273279,
+        778.316806, 779.360303, 780.403769, 781.447205, 782.490610, 783.533986,
+        784.577331, 785.620646, 786.663931, 787.707186, 788.750412, 789.793607,
+        790.836773, 791.879909, 792.923016, 793.966092, 795.009140, 796.052158,
+        797.095146, 798.138105, 799.181035, 800.223936, 801.266807, 802.309650,
+        803.352463, 804.395247, 805.438003, 806.480730, 807.523427, 808.566097,
+        809.608737, 810.651349, 811.693932, 812.736487, 813.779013, 814.821511,
+        815.863980, 816.906421, 817.948834, 818.991219, 820.033576, 821.075905,
+        822.118205, 823.160478, 824.202723, 825.244940, 826.287129, 827.329290,
+        828.371424, 829.413530, 830.455609, 831.497660, 832.539683, 833.581680,
+        834.623648, 835.665590, 836.707504, 837.749392, 838.791252, 839.833084,
+        840.874890, 841.916669, 842.958421, 844.000146, 845.041845, 846.083516,
+        847.125161, 848.166779, 849.208370, 850.249935, 851.291474, 852.332986,
+        853.374471, 854.415930, 855.457363, 856.498770, 857.540150, 858.581504,
+        859.622833, 860.664135, 861.705411, 862.746661, 863.787885, 864.829083,
+        865.870255, 866.911402, 867.952523, 868.993618, 870.034688, 871.075732,
+        872.116751, 873.157744, 874.198711, 875.239653, 876.280570, 877.321462,
+        878.362328, 879.403169, 880.443985, 881.484776, 882.525542, 883.566283,
+        884.606998, 885.647689, 886.688355, 887.728996, 888.769613, 889.810204,
+        890.850771, 891.891314, 892.931831, 893.972324, 895.012793, 896.053237,
+        897.093657, 898.134052, 899.174423, 900.214770, 901.255092, 902.295390,
+        903.335664, 904.375914, 905.416140, 906.456342, 907.496520, 908.536674,
+        909.576803, 910.616910, 911.656992, 912.697050, 913.737085, 914.777096,
+        915.817083, 916.857047, 917.896987, 918.936904, 919.976797, 921.016667,
+        922.056513, 923.096336, 924.136136, 925.175912, 926.215665, 927.255395,
+        928.295102, 929.334786, 930.374446, 931.414084, 932.453698, 933.493290,
+        934.532859, 935.572404, 936.611927, 937.651428, 938.690905, 939.730360,
+        940.769792, 941.809201, 942.848588, 943.887952, 944.927294, 945.966613,
+        947.005909, 948.045184, 949.084436, 950.123665, 951.162873, 952.202058,
+        953.241220, 954.280361, 955.319480, 956.358576, 957.397650, 958.436703,
+        959.475733, 960.514741, 961.553728, 962.592692, 963.631635, 964.670556,
+        965.709455, 966.748332, 967.787188, 968.826022, 969.864834, 970.903625,
+        971.942394, 972.981142, 974.019868, 975.058573, 976.097256, 977.135918,
+        978.174559, 979.213178, 980.251776, 981.290353, 982.328909, 983.367443,
+        984.405956, 985.444449, 986.482920, 987.521370, 988.559799, 989.598207,
+        990.636595, 991.674961, 992.713306, 993.751631, 994.789935, 995.828218,
+        996.866481, 997.904722, 998.942943, 999.981144, 1001.019324, 1002.057483,
+        1003.095622, 1004.133740, 1005.171838, 1006.209915, 1007.247973, 1008.286009,
+        1009.324026, 1010.362022, 1011.399997, 1012.437953, 1013.475888, 1014.513804,
+        1015.551699, 1016.589574, 1017.627429, 1018.665264, 1019.703079, 1020.740873,
+        1021.778648, 1022.816404, 1023.854139, 1024.891854, 1025.929550, 1026.967225,
+        1028.004881, 1029.042518, 1030.080134, 1031.117731, 1032.155309, 1033.192866,
+        1034.230404, 1035.267923, 1036.305422, 1037.342902, 1038.380362, 1039.417803,
+        1040.455224, 1041.492626, 1042.530009, 1043.567372, 1044.604717, 1045.642041,
+        1046.679347, 1047.716634, 1048.753901, 1049.791149, 1050.828379, 1051.865589,
+        1052.902780, 1053.939952, 1054.977105, 1056.014239, 1057.051355, 1058.088451,
+        1059.125529, 1060.162587, 1061.199627, 1062.236648, 1063.273651, 1064.310635,
+        1065.347600, 1066.384546, 1067.421474, 1068.458383, 1069.495273, 1070.532146,
+        1071.568999, 1072.605834, 1073.642651, 1074.679449,
+    ]),
+    0.025: array("d", [
+        5.023886, 7.377759, 9.348404, 11.143287, 12.832502, 14.449375,
+        16.012764, 17.534546, 19.022768, 20.483177, 21.920049, 23.336664,
+        24.735605, 26.118948, 27.488393, 28.845351, 30.191009, 31.526378,
+        32.852327, 34.169607, 35.478876, 36.780712, 38.075627, 39.364077,
+        40.646469, 41.923170, 43.194511, 44.460792, 45.722286, 46.979242,
+        48.231890, 49.480438, 50.725080, 51.965995, 53.203349, 54.437294,
+        55.667973, 56.895521, 58.120060, 59.341707, 60.560572, 61.776756,
+        62.990356, 64.201461, 65.410159, 66.616529, 67.820647, 69.022586,
+        70.222414, 71.420195, 72.615992, 73.809863, 75.001864, 76.192048,
+        77.380466, 78.567165, 79.752192, 80.935592, 82.117406, 83.297675,
+        84.476437, 85.653731, 86.829591, 88.004051, 89.177145, 90.348904,
+        91.519359, 92.688539, 93.856471, 95.023184, 96.188704, 97.353055,
+        98.516262, 99.678349, 100.839338, 101.999252, 103.158112, 104.315938,
+        105.472750, 106.628568, 107.783410, 108.937294, 110.090238, 111.242259,
+        112.393374, 113.543598, 114.692947, 115.841436, 116.989080, 118.135893,
+        119.281889, 120.427081, 121.571483, 122.715107, 123.857967, 125.000073,
+        126.141437, 127.282072, 128.421989, 129.561197, 130.699709, 131.837533,
+        132.974681, 134.111163, 135.246987, 136.382163, 137.516701, 138.650610,
+        139.783897, 140.916573, 142.048644, 143.180120, 144.311008, 145.441316,
+        146.571052, 147.700223, 148.828836, 149.956899, 151.084419, 152.211403,
+        153.337856, 154.463787, 155.589201, 156.714104, 157.838503, 158.962404,
+        160.085812, 161.208735, 162.331176, 163.453142, 164.574639, 165.695672,
+        166.816245, 167.936365, 169.056036, 170.175263, 171.294052, 172.412406,
+        173.530332, 174.647832, 175.764913, 176.881578, 177.997831, 179.113678,
+        180.229122, 181.344168, 182.458819, 183.573080, 184.686955, 185.800447,
+        186.913560, 188.026299, 189.138666, 190.250666, 191.362302, 192.473577,
+        193.584495, 194.695060, 195.805275, 196.915142, 198.024666, 199.133850,
+        200.242696, 201.351208, 202.459389, 203.567242, 204.674770, 205.781976,
+        206.888862, 207.995432, 209.101688, 210.207633, 211.313269, 212.418601,
+        213.523629, 214.628357, 215.732787, 216.836922, 217.940765, 219.044317,
+        220.147581, 221.250560, 222.353255, 223.455670, 224.557806, 225.659666,
+        226.761252, 227.862566, 228.963611, 230.064387, 231.164899, 232.265147,
+        233.365134, 234.464862, 235.564333, 236.663548, 237.762510, 238.861221,
+        239.959682, 241.057896, 242.155863, 243.253588, 244.351070, 245.448311,
+        246.545315, 247.642081, 248.738613, 249.834911, 250.930977, 252.026814,
+        253.122422, 254.217804, 255.312960, 256.407893, 257.502604, 258.597095,
+        259.691366, 260.785421, 261.879259, 262.972883, 264.066294, 265.159494,
+        266.252484, 267.345265, 268.437839, 269.530207, 270.622370, 271.714330,
+        272.806089, 273.897647, 274.989006, 276.080167, 277.171132, 278.261901,
+        279.352476, 280.442858, 281.533049, 282.623049, 283.712861, 284.802484,
+        285.891920, 286.981171, 288.070237, 289.159120, 290.247820, 291.336340,
+        292.424679, 293.512840, 294.600822, 295.688628, 296.776258, 297.863714,
+        298.950996, 300.038105, 301.125043, 302.211810, 303.298408, 304.384837,
+        305.471098, 306.557193, 307.643122, 308.728887, 309.814488, 310.899926,
+        311.985202, 313.070317, 314.155272, 315.240068, 316.324705, 317.409185,
+        318.493509, 319.577677, 320.661690, 321.745549, 322.829256, 323.912809,
+        324.996212, 326.079464, 327.162566, 328.245519, 329.328323, 330.410981,
+        331.493492, 332.575856, 333.658076, 334.740152, 335.822084, 336.903873,
+        337.985520, 339.067026, 340.148391, 341.229616, 342.310703, 343.391650,
+        344.472460, 345.553133, 346.633670, 347.714071, 348.794337, 349.874469,
+        350.954467, 352.034332, 353.114065, 354.193666, 355.273137, 356.352477,
+        357.431687, 358.510768, 359.589721, 360.668546, 361.747244, 362.825815,
+        363.904260, 364.982580, 366.060775, 367.138846, 368.216793, 369.294618,
+        370.372320, 371.449900, 372.527359, 373.604697, 374.681915, 375.759013,
+        376.835993, 377.912854, 378.989597, 380.066222, 381.142731, 382.219123,
+        383.295400, 384.371561, 385.447608, 386.523540, 387.599359, 388.675064,
+        389.750657, 390.826138, 391.901506, 392.976764, 394.051911, 395.126948,
+        396.201875, 397.276692, 398.351401, 399.426002, 400.500495, 401.574880,
+        402.649158, 403.723330, 404.797396, 405.871357, 406.945212, 408.018963,
+        409.092609, 410.166152, 411.239592, 412.312928, 413.386162, 414.459294,
+        415.532325, 416.605254, 417.678082, 418.750810, 419.823439, 420.895967,
+        421.968397, 423.040727, 424.112960, 425.185095, 426.257132, 427.329072,
+        428.400915, 429.472662, 430.544313, 431.615868, 432.687328, 433.758694,
+        434.829965, 435.901141, 436.972225, 438.043215, 439.114111, 440.184916,
+        441.255628, 442.326248, 443.396777, 444.467215, 445.537561, 446.607818,
+        447.677984, 448.748060, 449.818048, 450.887946, 451.957755, 453.027476,
+        454.097109, 455.166654, 456.236111, 457.305482, 458.374766, 459.443963,
+        460.513075, 461.582100, 462.651040, 463.719895, 464.788666, 465.857351,
+        466.925953, 467.994470, 469.062904, 470.131255, 471.199523, 472.267708,
+        473.335811, 474.403831, 475.471770, 476.539627, 477.607404, 478.675099,
+        479.742714, 480.810248, 481.877702, 482.945077, 484.012372, 485.079588,
+        486.146725, 487.213783, 488.280763, 489.347665, 490.414489, 491.481235,
+        492.547904, 493.614497, 494.681012, 495.747451, 496.813814, 497.880101,
+        498.946312, 500.012447, 501.078508, 502.144493, 503.210404, 504.276241,
+        505.342003, 506.407692, 507.473306, 508.538848, 509.604316, 510.669711,
+        511.735034, 512.800284, 513.865462, 514.930568, 515.995602, 517.060565,
+        518.125457, 519.190277, 520.255027, 521.319706, 522.384315, 523.448854,
+        524.513322, 525.577722, 526.642052, 527.706312, 528.770504, 529.834627,
+        530.898681, 531.962667, 533.026585, 534.090436, 535.154218, 536.217933,
+        537.281581, 538.345162, 539.408676, 540.472123, 541.535504, 542.598819,
+        543.662068, 544.725251, 545.788368, 546.851421, 547.914408, 548.977330,
+        550.040187, 551.102980, 552.165708, 553.228373, 554.290973, 555.353509,
+        556.415982, 557.478392, 558.540738, 559.603022, 560.665242, 561.727400,
+        562.789496, 563.851529, 564.913501, 565.975410, 567.037258, 568.099044,
+        569.160769, 570.222433, 571.284036, 572.345578, 573.407059, 574.468481,
+        575.529841, 576.591142, 577.652383, 578.713564, 579.774686, 580.835748,
+        581.896752, 582.957696, 584.018581, 585.079408, 586.140176, 587.200886,
+        588.261537, 589.322131, 590.382667, 591.443145, 592.503566, 593.563929,
+        594.624235, 595.684484, 596.744677, 597.804812, 598.864891, 599.924914,
+        600.984880, 602.044791, 603.104645, 604.164444, 605.224187, 606.283875,
+        607.343507, 608.403085, 609.462607, 610.522075, 611.581488, 612.640846,
+        613.700150, 614.759400, 615.818595, 616.877737, 617.936825, 618.995859,
+        620.054840, 621.113768, 622.172642, 623.231463, 624.290232, 625.348947,
+        626.407610, 627.466221, 628.524779, 629.583285, 630.641739, 631.700141,
+        632.758491, 633.816790, 634.875037, 635.933232, 636.991377, 638.049470,
+        639.107512, 640.165504, 641.223445, 642.281335, 643.339175, 644.396964,
+        645.454703, 646.512393, 647.570032, 648.627622, 649.685162, 650.742652,
+        651.800093, 652.857485, 653.914827, 654.972121, 656.029365, 657.086561,
+        658.143708, 659.200807, 660.257857, 661.314859, 662.371813, 663.428719,
+        664.485577, 665.542387, 666.599150, 667.655865, 668.712532, 669.769152,
+        670.825725, 671.882251, 672.938730, 673.995162, 675.051548, 676.107886,
+        677.164179, 678.220424, 679.276624, 680.332778, 681.388885, 682.444947,
+        683.500962, 684.556932, 685.612857, 686.668736, 687.724569, 688.780358,
+        689.836101, 690.891799, 691.947452, 693.003061, 694.058624, 695.114143,
+        696.169618, 697.225048, 698.280434, 699.335776, 700.391074, 701.446327,
+        702.501537, 703.556703, 704.611826, 705.666905, 706.721940, 707.776932,
+        708.831881, 709.886787, 710.941649, 711.996469, 713.051246, 714.105980,
+        715.160672, 716.215321, 717.269927, 718.324492, 719.379014, 720.433493,
+        721.487931, 722.542327, 723.596681, 724.650993, 725.705264, 726.759493,
+        727.813681, 728.867827, 729.921932, 730.975995, 732.030018, 733.084000,
+        734.137940, 735.191840, 736.245700, 737.299518, 738.353296, 739.407034,
+        740.460731, 741.514388, 742.568005, 743.621582, 744.675118, 745.728615,
+        746.782072, 747.835490, 748.888867, 749.942205, 750.995504, 752.048763,
+        753.101984, 754.155164, 755.208306, 756.261409, 757.314473, 758.367497,
+        759.420484, 760.473431, 761.526340, 762.579210, 763.632042, 764.684836,
+        765.737591, 766.790308, 767.842987, 768.895628, 769.948231, 771.000797,
+        772.053324, 773.105814, 774.158266, 775.210681, 776.263058, 777.315398,
+        778.367700, 779.419965, 780.472194, 781.524385, 782.576539, 783.628656,
+        784.680737, 785.732781, 786.784788, 787.836758, 788.888692, 789.940590,
+        790.992451, 792.044276, 793.096065, 794.147818, 795.199534, 796.251215,
+        797.302860, 798.354468, 799.406042, 800.457579, 801.509081, 802.560547,
+        803.611978, 804.663374, 805.714734, 806.766059, 807.817349, 808.868604,
+        809.919824, 810.971008, 812.022158, 813.073273, 814.124354, 815.175400,
+        816.226411, 817.277387, 818.328330, 819.379237, 820.430111, 821.480950,
+        822.531755, 823.582526, 824.633263, 825.683966, 826.734635, 827.785270,
+        828.835872, 829.886440, 830.936974, 831.987474, 833.037942, 834.088375,
+        835.138776, 836.189143, 837.239476, 838.289777, 839.340045, 840.390279,
+        841.440481, 842.490649, 843.540785, 844.590888, 845.640958, 846.690996,
+        847.741001, 848.790974, 849.840914, 850.890822, 851.940697, 852.990540,
+        854.040351, 855.090130, 856.139876, 857.189591, 858.239274, 859.288925,
+        860.338544, 861.388131, 862.437687, 863.487210, 864.536703, 865.586163,
+        866.635593, 867.684991, 868.734357, 869.783692, 870.832996, 871.882269,
+        872.931511, 873.980722, 875.029901, 876.079050, 877.128168, 878.177255,
+        879.226311, 880.275337, 881.324332, 882.373296, 883.422230, 884.471133,
+        885.520006, 886.568849, 887.617661, 888.666443, 889.715195, 890.763917,
+        891.812608, 892.861270, 893.909902, 894.958503, 896.007075, 897.055617,
+        898.104129, 899.152612, 900.201065, 901.249488, 902.297882, 903.346247,
+        904.394582, 905.442887, 906.491163, 907.539410, 908.587628, 909.635817,
+        910.683976, 911.732107, 912.780208, 913.828281, 914.876325, 915.924339,
+        916.972325, 918.020283, 919.068211, 920.116111, 921.163983, 922.211825,
+        923.259640, 924.307426, 925.355183, 926.402912, 927.450613, 928.498286,
+        929.545931, 930.593547, 931.641135, 932.688696, 933.736228, 934.783732,
+        935.831209, 936.878657, 937.926078, 938.973471, 940.020837, 941.068175,
+        942.115485, 943.162768, 944.210023, 945.257251, 946.304451, 947.351624,
+        948.398770, 949.445888, 950.492979, 951.540043, 952.587080, 953.634090,
+        954.681073, 955.728029, 956.774958, 957.821860, 958.868735, 959.915584,
+        960.962405, 962.009200, 963.055969, 964.102710, 965.149426, 966.196114,
+        967.242776, 968.289412, 969.336022, 970.382605, 971.429161, 972.475692,
+        973.522196, 974.568674, 975.615127, 976.661552, 977.707952, 978.754326,
+        979.800674, 980.846997, 981.893293, 982.939563, 983.985808, 985.032027,
+        986.078220, 987.124388, 988.170530, 989.216646, 990.262737, 991.308803,
+        992.354843, 993.400858, 994.446847, 995.492811, 996.538750, 997.584664,
+        998.630552, 999.676415, 1000.722254, 1001.768067, 1002.813855, 1003.859618,
+        1004.905356, 1005.951070, 1006.996758, 1008.042422, 1009.088061, 1010.133675,
+        1011.179265, 1012.224829, 1013.270370, 1014.315885, 1015.361377, 1016.406843,
+        1017.452285, 1018.497703, 1019.543097, 1020.588466, 1021.633811, 1022.679131,
+        1023.724428, 1024.769700, 1025.814948, 1026.860172, 1027.905372, 1028.950548,
+        1029.995700, 1031.040828, 1032.085932, 1033.131012, 1034.176068, 1035.221101,
+        1036.266110, 1037.311095, 1038.356056, 1039.400994, 1040.445908, 1041.490799,
+        1042.535666, 1043.580509, 1044.625329, 1045.670126, 1046.714900, 1047.759649,
+        1048.804376, 1049.849080, 1050.893760, 1051.938417, 1052.983050, 1054.027661,
+        1055.072249, 1056.116813, 1057.161355, 1058.205873, 1059.250369, 1060.294841,
+        1061.339291, 1062.383718, 1063.428122, 1064.472503, 1065.516862, 1066.561198,
+        1067.605511, 1068.649802, 1069.694070, 1070.738315, 1071.782538, 1072.826738,
+        1073.870916, 1074.915072, 1075.959205, 1077.003316, 1078.047404, 1079.091470,
+        1080.135514, 1081.179536, 1082.223535, 1083.267512, 1084.311468, 1085.355401,
+        1086.399312, 1087.443201, 1088.487068, 1089.530913,
+    ]),
+    0.01: array("d", [
+        6.634897, 9.210340, 11.344867, 13.276704, 15.086272, 16.811894,
+        18.475307, 20.090235, 21.665994, 23.209251, 24.724970, 26.216967,
+        27.688250, 29.141238, 30.577914, 31.999927, 33.408664, 34.805306,
+        36.190869, 37.566235, 38.932173, 40.289360, 41.638398, 42.979820,
+        44.314105, 45.641683, 46.962942, 48.278236, 49.587884, 50.892181,
+        52.191395, 53.485772, 54.775540, 56.060909, 57.342073, 58.619215,
+        59.892500, 61.162087, 62.428121, 63.690740, 64.950071, 66.206236,
+        67.459348, 68.709513, 69.956832, 71.201400, 72.443307, 73.682639,
+        74.919474, 76.153891, 77.385962, 78.615756, 79.843338, 81.068772,
+        82.292117, 83.513430, 84.732766, 85.950176, 87.165711, 88.379419,
+        89.591344, 90.801532, 92.010024, 93.216860, 94.422079, 95.625719,
+        96.827816, 98.028403, 99.227515, 100.425184, 101.621441, 102.816314,
+        104.009834, 105.202028, 106.392923, 107.582545, 108.770919, 109.958069,
+        111.144019, 112.328793, 113.512410, 114.694895, 115.876266, 117.056544,
+        118.235749, 119.413900, 120.591015, 121.767111, 122.942207, 124.116319,
+        125.289463, 126.461656, 127.632913, 128.803249, 129.972679, 131.141217,
+        132.308877, 133.475672, 134.641617, 135.806723, 136.971004, 138.134471,
+        139.297137, 140.459013, 141.620111, 142.780442, 143.940016, 145.098844,
+        146.256938, 147.414305, 148.570958, 149.726905, 150.882155, 152.036719,
+        153.190604, 154.343821, 155.496377, 156.648281, 157.799541, 158.950166,
+        160.100163, 161.249540, 162.398305, 163.546466, 164.694028, 165.841001,
+        166.987390, 168.133203, 169.278446, 170.423127, 171.567251, 172.710824,
+        173.853854, 174.996347, 176.138307, 177.279742, 178.420656, 179.561057,
+        180.700949, 181.840337, 182.979228, 184.117626, 185.255537, 186.392965,
+        187.529917, 188.666396, 189.802408, 190.937957, 192.073048, 193.207686,
+        194.341876, 195.475620, 196.608925, 197.741794, 198.874232, 200.006243,
+        201.137830, 202.268999, 203.399752, 204.530095, 205.660030, 206.789561,
+        207.918693, 209.047428, 210.175771, 211.303725, 212.431294, 213.558481,
+        214.685289, 215.811722, 216.937783, 218.063476, 219.188803, 220.313769,
+        221.438375, 222.562625, 223.686522, 224.810069, 225.933269, 227.056125,
+        228.178639, 229.300816, 230.422656, 231.544164, 232.665341, 233.786191,
+        234.906717, 236.026920, 237.146803, 238.266369, 239.385621, 240.504560,
+        241.623190, 242.741512, 243.859529, 244.977244, 246.094658, 247.211775,
+        248.328596, 249.445123, 250.561359, 251.677306, 252.792966, 253.908341,
+        255.023433, 256.138244, 257.252777, 258.367033, 259.481015, 260.594724,
+        261.708162, 262.821332, 263.934234, 265.046872, 266.159246, 267.271359,
+        268.383212, 269.494808, 270.606148, 271.717234, 272.828067, 273.938649,
+        275.048983, 276.159069, 277.268909, 278.378506, 279.487859, 280.596972,
+        281.705846, 282.814482, 283.922882, 285.031047, 286.138979, 287.246680,
+        288.354150, 289.461392, 290.568407, 291.675195, 292.781760, 293.888101,
+        294.994221, 296.100121, 297.205802, 298.311266, 299.416514, 300.521546,
+        301.626366, 302.730973, 303.835369, 304.939556, 306.043534, 307.147305,
+        308.250870, 309.354231, 310.457388, 311.560343, 312.663097, 313.765651,
+        314.868006, 315.970164, 317.072125, 318.173891, 319.275462, 320.376841,
+        321.478028, 322.579023, 323.679829, 324.780446, 325.880876, 326.981118,
+        328.081175, 329.181048, 330.280737, 331.380243, 332.479568, 333.578712,
+        334.677677, 335.776463, 336.875071, 337.973503, 339.071759, 340.169840,
+        341.267747, 342.365481, 343.463043, 344.560434, 345.657655, 346.754706,
+        347.851589, 348.948304, 350.044853, 351.141236, 352.237453, 353.333507,
+        354.429397, 355.525124, 356.620690, 357.716095, 358.811340, 359.906426,
+        361.001353, 362.096123, 363.190735, 364.285192, 365.379493, 366.473640,
+        367.567633, 368.661472, 369.755160, 370.848696, 371.942080, 373.035315,
+        374.128401, 375.221338, 376.314126, 377.406768, 378.499263, 379.591612,
+        380.683816, 381.775875, 382.867790, 383.959563, 385.051193, 386.142681,
+        387.234027, 388.325234, 389.416300, 390.507227, 391.598016, 392.688667,
+        393.779180, 394.869556, 395.959797, 397.049902, 398.139872, 399.229708,
+        400.319410, 401.408979, 402.498416, 403.587720, 404.676894, 405.765936,
+        406.854849, 407.943632, 409.032286, 410.120811, 411.209208, 412.297478,
+        413.385622, 414.473639, 415.561530, 416.649296, 417.736937, 418.824455,
+        419.911848, 420.999119, 422.086267, 423.173293, 424.260197, 425.346981,
+        426.433644, 427.520186, 428.606610, 429.692914, 430.779100, 431.865167,
+        432.951118, 434.036951, 435.122667, 436.208267, 437.293752, 438.379121,
+        439.464376, 440.549516, 441.634543, 442.719456, 443.804257, 444.888945,
+        445.973520, 447.057985, 448.142338, 449.226580, 450.310712, 451.394735,
+        452.478648, 453.562452, 454.646147, 455.729735, 456.813214, 457.896587,
+        458.979852, 460.063011, 461.146064, 462.229011, 463.311853, 464.394590,
+        465.477223, 466.559752, 467.642177, 468.724498, 469.806717, 470.888833,
+        471.970848, 473.052760, 474.134571, 475.216281, 476.297890, 477.379400,
+        478.460809, 479.542119, 480.623329, 481.704441, 482.785454, 483.866370,
+        484.947187, 486.027908, 487.108531, 488.189057, 489.269488, 490.349822,
+        491.430061, 492.510204, 493.590252, 494.670206, 495.750066, 496.829831,
+        497.909503, 498.989082, 500.068567, 501.147961, 502.227261, 503.306470,
+        504.385587, 505.464613, 506.543548, 507.622392, 508.701145, 509.779809,
+        510.858382, 511.936867, 513.015262, 514.093568, 515.171785, 516.249915,
+        517.327956, 518.405909, 519.483776, 520.561555, 521.639247, 522.716853,
+        523.794373, 524.871806, 525.949154, 527.026417, 528.103595, 529.180687,
+        530.257696, 531.334620, 532.411460, 533.488216, 534.564889, 535.641478,
+        536.717985, 537.794410, 538.870751, 539.947011, 541.023189, 542.099286,
+        543.175301, 544.251235, 545.327088, 546.402861, 547.478554, 548.554166,
+        549.629699, 550.705152, 551.780526, 552.855821, 553.931038, 555.006175,
+        556.081235, 557.156216, 558.231120, 559.305946, 560.380695, 561.455367,
+        562.529962, 563.604480, 564.678922, 565.753288, 566.827578, 567.901793,
+        568.975932, 570.049996, 571.123985, 572.197899, 573.271738, 574.345504,
+        575.419195, 576.492813, 577.566356, 578.639827, 579.713224, 580.786548,
+        581.859800, 582.932979, 584.006086, 585.079121, 586.152083, 587.224974,
+        588.297794, 589.370543, 590.443220, 591.515826, 592.588362, 593.660828,
+        594.733223, 595.805549, 596.877804, 597.949990, 599.022106, 600.094154,
+        601.166132, 602.238041, 603.309882, 604.381655, 605.453359, 606.524995,
+        607.596563, 608.668064, 609.739497, 610.810863, 611.882162, 612.953394,
+        614.024559, 615.095658, 616.166691, 617.237657, 618.308558, 619.379392,
+        620.450161, 621.520865, 622.591504, 623.662077, 624.732586, 625.803029,
+        626.873409, 627.943724, 629.013975, 630.084162, 631.154285, 632.224344,
+        633.294340, 634.364273, 635.434143, 636.503949, 637.573693, 638.643375,
+        639.712994, 640.782550, 641.852045, 642.921477, 643.990848, 645.060157,
+        646.129405, 647.198591, 648.267717, 649.336781, 650.405785, 651.474728,
+        652.543610, 653.612433, 654.681195, 655.749897, 656.818539, 657.887122,
+        658.955645, 660.024108, 661.092513, 662.160858, 663.229144, 664.297372,
+        665.365541, 666.433652, 667.501704, 668.569698, 669.637634, 670.705512,
+        671.773333, 672.841096, 673.908801, 674.976450, 676.044041, 677.111575,
+        678.179052, 679.246473, 680.313837, 681.381144, 682.448396, 683.515591,
+        684.582730, 685.649814, 686.716841, 687.783813, 688.850730, 689.917591,
+        690.984397, 692.051149, 693.117845, 694.184486, 695.251073, 696.317606,
+        697.384084, 698.450507, 699.516877, 700.583193, 701.649455, 702.715663,
+        703.781818, 704.847919, 705.913967, 706.979962, 708.045904, 709.111792,
+        710.177628, 711.243412, 712.309143, 713.374821, 714.440447, 715.506021,
+        716.571543, 717.637013, 718.702431, 719.767798, 720.833113, 721.898376,
+        722.963589, 724.028750, 725.093860, 726.158919, 727.223927, 728.288884,
+        729.353791, 730.418648, 731.483454, 732.548210, 733.612916, 734.677571,
+        735.742177, 736.806733, 737.871240, 738.935697, 740.000104, 741.064463,
+        742.128771, 743.193031, 744.257242, 745.321404, 746.385518, 747.449582,
+        748.513598, 749.577566, 750.641485, 751.705357, 752.769180, 753.832955,
+        754.896682, 755.960362, 757.023993, 758.087578, 759.151114, 760.214604,
+        761.278046, 762.341441, 763.404789, 764.468090, 765.531345, 766.594552,
+        767.657713, 768.720828, 769.783896, 770.846918, 771.909893, 772.972823,
+        774.035706, 775.098544, 776.161336, 777.224082, 778.286782, 779.349437,
+        780.412047, 781.474611, 782.537130, 783.599604, 784.662033, 785.724417,
+        786.786756, 787.849051, 788.911301, 789.973506, 791.035667, 792.097784,
+        793.159856, 794.221884, 795.283869, 796.345809, 797.407705, 798.469558,
+        799.531367, 800.593132, 801.654854, 802.716532, 803.778167, 804.839759,
+        805.901308, 806.962814, 808.024277, 809.085697, 810.147074, 811.208408,
+        812.269700, 813.330949, 814.392156, 815.453321, 816.514444, 817.575524,
+        818.636562, 819.697558, 820.758512, 821.819425, 822.880296, 823.941125,
+        825.001913, 826.062659, 827.123363, 828.184027, 829.244649, 830.305230,
+        831.365770, 832.426270, 833.486728, 834.547145, 835.607522, 836.667858,
+        837.728154, 838.788409, 839.848624, 840.908798, 841.968932, 843.029026,
+        844.089081, 845.149095, 846.209069, 847.269003, 848.328898, 849.388752,
+        850.448568, 851.508344, 852.568080, 853.627777, 854.687435, 855.747053,
+        856.806633, 857.866173, 858.925675, 859.985137, 861.044561, 862.103946,
+        863.163292, 864.222600, 865.281869, 866.341100, 867.400293, 868.459447,
+        869.518563, 870.577641, 871.636680, 872.695682, 873.754646, 874.813572,
+        875.872460, 876.931311, 877.990124, 879.048899, 880.107637, 881.166338,
+        882.225001, 883.283627, 884.342215, 885.400767, 886.459281, 887.517759,
+        888.576199, 889.634603, 890.692970, 891.751300, 892.809594, 893.867851,
+        894.926072, 895.984256, 897.042403, 898.100515, 899.158590, 900.216629,
+        901.274632, 902.332599, 903.390530, 904.448425, 905.506284, 906.564108,
+        907.621896, 908.679648, 909.737365, 910.795046, 911.852692, 912.910302,
+        913.967877, 915.025417, 916.082921, 917.140391, 918.197826, 919.255225,
+        920.312590, 921.369919, 922.427214, 923.484475, 924.541700, 925.598891,
+        926.656048, 927.713170, 928.770257, 929.827311, 930.884330, 931.941314,
+        932.998265, 934.055181, 935.112064, 936.168912, 937.225727, 938.282508,
+        939.339254, 940.395968, 941.452647, 942.509293, 943.565905, 944.622484,
+        945.679029, 946.735541, 947.792020, 948.848466, 949.904878, 950.961257,
+        952.017603, 953.073916, 954.130196, 955.186443, 956.242657, 957.298838,
+        958.354987, 959.411103, 960.467187, 961.523237, 962.579256, 963.635242,
+        964.691195, 965.747116, 966.803005, 967.858862, 968.914686, 969.970478,
+        971.026238, 972.081967, 973.137663, 974.193327, 975.248960, 976.304561,
+        977.360130, 978.415667, 979.471173, 980.526647, 981.582090, 982.637501,
+        983.692880, 984.748229, 985.803546, 986.858832, 987.914086, 988.969310,
+        990.024502, 991.079664, 992.134794, 993.189893, 994.244962, 995.300000,
+        996.355007, 997.409983, 998.464928, 999.519843, 1000.574728, 1001.629581,
+        1002.684405, 1003.739198, 1004.793960, 1005.848692, 1006.903394, 1007.958066,
+        1009.012708, 1010.067319, 1011.121901, 1012.176452, 1013.230973, 1014.285465,
+        1015.339926, 1016.394358, 1017.448760, 1018.503132, 1019.557475, 1020.611788,
+        1021.666071, 1022.720325, 1023.774549, 1024.828744, 1025.882910, 1026.937046,
+        1027.991153, 1029.045231, 1030.099279, 1031.153298, 1032.207288, 1033.261250,
+        1034.315182, 1035.369085, 1036.422959, 1037.476804, 1038.530621, 1039.584409,
+        1040.638168, 1041.691898, 1042.745600, 1043.799273, 1044.852918, 1045.906534,
+        1046.960121, 1048.013680, 1049.067211, 1050.120714, 1051.174188, 1052.227634,
+        1053.281052, 1054.334442, 1055.387803, 1056.441137, 1057.494442, 1058.547720,
+        1059.600969, 1060.654191, 1061.707385, 1062.760551, 1063.813689, 1064.866800,
+        1065.919883, 1066.972939, 1068.025966, 1069.078967, 1070.131939, 1071.184885,
+        1072.237803, 1073.290693, 1074.343557, 1075.396393, 1076.449201, 1077.501983,
+        1078.554737, 1079.607465, 1080.660165, 1081.712838, 1082.765484, 1083.818104,
+        1084.870696, 1085.923262, 1086.975800, 1088.028312, 1089.080797, 1090.133256,
+        1091.185688, 1092.238093, 1093.290472, 1094.342824, 1095.395149, 1096.447449,
+        1097.499721, 1098.551968, 1099.604188, 1100.656382, 1101.708549, 1102.760690,
+        1103.812806, 1104.864895, 1105.916958, 1106.968994,
+    ]),
+    0.005: array("d", [
+        7.879439, 10.596635, 12.838156, 14.860259, 16.749602, 18.547584,
+        20.277740, 21.954955, 23.589351, 25.188180, 26.756849, 28.299519,
+        29.819471, 31.319350, 32.801321, 34.267187, 35.718466, 37.156451,
+        38.582257, 39.996846, 41.401065, 42.795655, 44.181275, 45.558512,
+        46.927890, 48.289882, 49.644915, 50.993376, 52.335618, 53.671962,
+        55.002704, 56.328115, 57.648445, 58.963926, 60.274771, 61.581179,
+        62.883335, 64.181412, 65.475571, 66.765962, 68.052726, 69.335997,
+        70.615900, 71.892550, 73.166061, 74.436535, 75.704073, 76.968768,
+        78.230708, 79.489978, 80.746659, 82.000826, 83.252551, 84.501905,
+        85.748952, 86.993755, 88.236375, 89.476870, 90.715293, 91.951698,
+        93.186135, 94.418653, 95.649297, 96.878113, 98.105144, 99.330430,
+        100.554011, 101.775925, 102.996209, 104.214899, 105.432028, 106.647630,
+        107.861736, 109.074377, 110.285583, 111.495383, 112.703803, 113.910872,
+        115.116615, 116.321057, 117.524222, 118.726134, 119.926817, 121.126292,
+        122.324581, 123.521704, 124.717683, 125.912536, 127.106284, 128.298944,
+        129.490534, 130.681073, 131.870578, 133.059065, 134.246550, 135.433049,
+        136.618578, 137.803151, 138.986783, 140.169489, 141.351283, 142.532177,
+        143.712185, 144.891320, 146.069595, 147.247022, 148.423613, 149.599379,
+        150.774332, 151.948483, 153.121843, 154.294423, 155.466234, 156.637285,
+        157.807586, 158.977148, 160.145979, 161.314089, 162.481488, 163.648184,
+        164.814186, 165.979502, 167.144142, 168.308113, 169.471423, 170.634081,
+        171.796093, 172.957469, 174.118214, 175.278337, 176.437845, 177.596744,
+        178.755042, 179.912745, 181.069861, 182.226395, 183.382353, 184.537744,
+        185.692571, 186.846842, 188.000563, 189.153738, 190.306375, 191.458479,
+        192.610055, 193.761108, 194.911645, 196.061670, 197.211189, 198.360206,
+        199.508727, 200.656756, 201.804299, 202.951360, 204.097944, 205.244056,
+        206.389699, 207.534879, 208.679600, 209.823866, 210.967682, 212.111051,
+        213.253978, 214.396467, 215.538522, 216.680147, 217.821345, 218.962121,
+        220.102479, 221.242421, 222.381952, 223.521075, 224.659795, 225.798113,
+        226.936035, 228.073562, 229.210699, 230.347449, 231.483815, 232.619801,
+        233.755409, 234.890642, 236.025505, 237.159999, 238.294128, 239.427894,
+        240.561302, 241.694352, 242.827050, 243.959396, 245.091394, 246.223047,
+        247.354357, 248.485328, 249.615961, 250.746259, 251.876225, 253.005862,
+        254.135171, 255.264155, 256.392818, 257.521160, 258.649185, 259.776895,
+        260.904292, 262.031379, 263.158157, 264.284629, 265.410797, 266.536664,
+        267.662231, 268.787501, 269.912475, 271.037157, 272.161547, 273.285648,
+        274.409462, 275.532991, 276.656237, 277.779201, 278.901886, 280.024294,
+        281.146426, 282.268285, 283.389872, 284.511188, 285.632237, 286.753019,
+        287.873536, 288.993790, 290.113783, 291.233517, 292.352992, 293.472211,
+        294.591176, 295.709888, 296.828348, 297.946559, 299.064521, 300.182237,
+        301.299707, 302.416934, 303.533919, 304.650663, 305.767169, 306.883436,
+        307.999468, 309.115264, 310.230828, 311.346159, 312.461260, 313.576132,
+        314.690776, 315.805193, 316.919385, 318.033354, 319.147100, 320.260625,
+        321.373930, 322.487016, 323.599885, 324.712538, 325.824976, 326.937200,
+        328.049212, 329.161013, 330.272604, 331.383985, 332.495159, 333.606127,
+        334.716889, 335.827447, 336.937802, 338.047954, 339.157906, 340.267658,
+        341.377212, 342.486567, 343.595726, 344.704690, 345.813459, 346.922034,
+        348.030418, 349.138609, 350.246611, 351.354423, 352.462046, 353.569483,
+        354.676732, 355.783797, 356.890676, 357.997373, 359.103886, 360.210218,
+        361.316369, 362.422341, 363.528133, 364.633748, 365.739185, 366.844446,
+        367.949532, 369.054443, 370.159181, 371.263746, 372.368139, 373.472360,
+        374.576412, 375.680294, 376.784008, 377.887554, 378.990933, 380.094146,
+        381.197194, 382.300077, 383.402796, 384.505352, 385.607747, 386.709979,
+        387.812051, 388.913963, 390.015716, 391.117311, 392.218748, 393.320028,
+        394.421151, 395.522119, 396.622933, 397.723592, 398.824098, 399.924451,
+        401.024652, 402.124702, 403.224602, 404.324351, 405.423951, 406.523403,
+        407.622706, 408.721863, 409.820872, 410.919736, 412.018454, 413.117028,
+        414.215458, 415.313744, 416.411887, 417.509889, 418.607748, 419.705467,
+        420.803046, 421.900484, 422.997784, 424.094945, 425.191968, 426.288854,
+        427.385602, 428.482215, 429.578692, 430.675034, 431.771241, 432.867315,
+        433.963255, 435.059062, 436.154737, 437.250281, 438.345693, 439.440974,
+        440.536126, 441.631147, 442.726040, 443.820804, 444.915440, 446.009949,
+        447.104331, 448.198586, 449.292715, 450.386719, 451.480598, 452.574352,
+        453.667983, 454.761490, 455.854874, 456.948135, 458.041275, 459.134293,
+        460.227189, 461.319966, 462.412622, 463.505158, 464.597575, 465.689874,
+        466.782054, 467.874116, 468.966061, 470.057889, 471.149601, 472.241196,
+        473.332676, 474.424041, 475.515291, 476.606427, 477.697449, 478.788357,
+        479.879152, 480.969835, 482.060405, 483.150864, 484.241212, 485.331448,
+        486.421574, 487.511590, 488.601496, 489.691292, 490.780980, 491.870559,
+        492.960030, 494.049394, 495.138650, 496.227799, 497.316841, 498.405777,
+        499.494607, 500.583332, 501.671952, 502.760467, 503.848878, 504.937184,
+        506.025388, 507.113487, 508.201484, 509.289379, 510.377171, 511.464862,
+        512.552451, 513.639938, 514.727326, 515.814612, 516.901799, 517.988886,
+        519.075873, 520.162762, 521.249552, 522.336243, 523.422837, 524.509332,
+        525.595731, 526.682032, 527.768237, 528.854345, 529.940357, 531.026273,
+        532.112094, 533.197820, 534.283451, 535.368988, 536.454430, 537.539779,
+        538.625034, 539.710195, 540.795264, 541.880240, 542.965124, 544.049916,
+        545.134616, 546.219224, 547.303742, 548.388168, 549.472504, 550.556750,
+        551.640906, 552.724972, 553.808949, 554.892836, 555.976635, 557.060345,
+        558.143967, 559.227501, 560.310947, 561.394306, 562.477578, 563.560763,
+        564.643861, 565.726872, 566.809798, 567.892638, 568.975392, 570.058061,
+        571.140645, 572.223144, 573.305559, 574.387889, 575.470136, 576.552299,
+        577.634378, 578.716374, 579.798287, 580.880117, 581.961865, 583.043531,
+        584.125115, 585.206617, 586.288037, 587.369377, 588.450635, 589.531813,
+        590.612910, 591.693926, 592.774863, 593.855720, 594.936497, 596.017196,
+        597.097814, 598.178355, 599.258816, 600.339199, 601.419504, 602.499731,
+        603.579880, 604.659952, 605.739947, 606.819864, 607.899705, 608.979469,
+        610.059156, 611.138768, 612.218303, 613.297763, 614.377148, 615.456457,
+        616.535691, 617.614850, 618.693934, 619.772944, 620.851880, 621.930742,
+        623.009529, 624.088244, 625.166885, 626.245452, 627.323947, 628.402369,
+        629.480718, 630.558995, 631.637200, 632.715332, 633.793393, 634.871383,
+        635.949301, 637.027147, 638.104923, 639.182628, 640.260262, 641.337826,
+        642.415320, 643.492743, 644.570097, 645.647381, 646.724596, 647.801741,
+        648.878817, 649.955824, 651.032763, 652.109633, 653.186434, 654.263168,
+        655.339833, 656.416431, 657.492961, 658.569423, 659.645818, 660.722146,
+        661.798407, 662.874602, 663.950730, 665.026791, 666.102786, 667.178715,
+        668.254578, 669.330376, 670.406108, 671.481774, 672.557375, 673.632912,
+        674.708383, 675.783790, 676.859132, 677.934410, 679.009623, 680.084773,
+        681.159858, 682.234880, 683.309838, 684.384733, 685.459565, 686.534334,
+        687.609039, 688.683682, 689.758262, 690.832780, 691.907236, 692.981629,
+        694.055961, 695.130230, 696.204438, 697.278585, 698.352670, 699.426694,
+        700.500657, 701.574559, 702.648400, 703.722180, 704.795900, 705.869560,
+        706.943160, 708.016699, 709.090179, 710.163599, 711.236959, 712.310260,
+        713.383502, 714.456685, 715.529808, 716.602873, 717.675879, 718.748826,
+        719.821715, 720.894546, 721.967318, 723.040033, 724.112689, 725.185288,
+        726.257830, 727.330313, 728.402740, 729.475109, 730.547421, 731.619677,
+        732.691875, 733.764017, 734.836102, 735.908131, 736.980104, 738.052020,
+        739.123881, 740.195686, 741.267435, 742.339128, 743.410766, 744.482348,
+        745.553876, 746.625348, 747.696765, 748.768127, 749.839435, 750.910688,
+        751.981887, 753.053031, 754.124121, 755.195157, 756.266139, 757.337067,
+        758.407942, 759.478763, 760.549530, 761.620244, 762.690905, 763.761513,
+        764.832067, 765.902569, 766.973018, 768.043415, 769.113759, 770.184050,
+        771.254289, 772.324476, 773.394611, 774.464694, 775.534725, 776.604705,
+        777.674633, 778.744509, 779.814334, 780.884108, 781.953831, 783.023502,
+        784.093123, 785.162693, 786.232212, 787.301681, 788.371099, 789.440467,
+        790.509784, 791.579052, 792.648269, 793.717437, 794.786554, 795.855622,
+        796.924640, 797.993609, 799.062529, 800.131399, 801.200220, 802.268991,
+        803.337714, 804.406388, 805.475014, 806.543590, 807.612118, 808.680598,
+        809.749029, 810.817412, 811.885747, 812.954034, 814.022272, 815.090463,
+        816.158607, 817.226702, 818.294750, 819.362751, 820.430704, 821.498610,
+        822.566469, 823.634281, 824.702046, 825.769764, 826.837435, 827.905060,
+        828.972638, 830.040170, 831.107655, 832.175094, 833.242487, 834.309833,
+        835.377134, 836.444389, 837.511598, 838.578761, 839.645879, 840.712951,
+        841.779978, 842.846959, 843.913895, 844.980786, 846.047632, 847.114433,
+        848.181189, 849.247900, 850.314567, 851.381189, 852.447766, 853.514299,
+        854.580788, 855.647232, 856.713632, 857.779989, 858.846301, 859.912569,
+        860.978793, 862.044974, 863.111111, 864.177204, 865.243254, 866.309261,
+        867.375224, 868.441144, 869.507021, 870.572855, 871.638646, 872.704394,
+        873.770100, 874.835762, 875.901382, 876.966960, 878.032494, 879.097987,
+        880.163437, 881.228845, 882.294211, 883.359535, 884.424817, 885.490057,
+        886.555255, 887.620411, 888.685526, 889.750599, 890.815631, 891.880621,
+        892.945570, 894.010478, 895.075345, 896.140170, 897.204955, 898.269698,
+        899.334401, 900.399062, 901.463684, 902.528264, 903.592804, 904.657303,
+        905.721762, 906.786181, 907.850560, 908.914898, 909.979196, 911.043454,
+        912.107672, 913.171851, 914.235989, 915.300088, 916.364147, 917.428167,
+        918.492147, 919.556087, 920.619989, 921.683850, 922.747673, 923.811457,
+        924.875201, 925.938907, 927.002573, 928.066201, 929.129790, 930.193340,
+        931.256852, 932.320325, 933.383759, 934.447155, 935.510513, 936.573832,
+        937.637113, 938.700356, 939.763561, 940.826728, 941.889857, 942.952948,
+        944.016001, 945.079016, 946.141994, 947.204934, 948.267837, 949.330702,
+        950.393530, 951.456320, 952.519073, 953.581789, 954.644468, 955.707110,
+        956.769714, 957.832282, 958.894813, 959.957307, 961.019764, 962.082184,
+        963.144568, 964.206916, 965.269227, 966.331501, 967.393739, 968.455941,
+        969.518106, 970.580236, 971.642329, 972.704386, 973.766407, 974.828392,
+        975.890342, 976.952255, 978.014133, 979.075975, 980.137782, 981.199553,
+        982.261289, 983.322989, 984.384653, 985.446283, 986.507877, 987.569436,
+        988.630960, 989.692448, 990.753902, 991.815321, 992.876705, 993.938054,
+        994.999368, 996.060648, 997.121893, 998.183103, 999.244279, 1000.305420,
+        1001.366527, 1002.427600, 1003.488638, 1004.549642, 1005.610612, 1006.671547,
+        1007.732449, 1008.793316, 1009.854150, 1010.914950, 1011.975716, 1013.036448,
+        1014.097146, 1015.157811, 1016.218442, 1017.279039, 1018.339603, 1019.400134,
+        1020.460631, 1021.521095, 1022.581525, 1023.641922, 1024.702286, 1025.762617,
+        1026.822915, 1027.883180, 1028.943412, 1030.003611, 1031.063777, 1032.123910,
+        1033.184011, 1034.244079, 1035.304114, 1036.364117, 1037.424087, 1038.484025,
+        1039.543930, 1040.603803, 1041.663643, 1042.723451, 1043.783228, 1044.842971,
+        1045.902683, 1046.962363, 1048.022011, 1049.081626, 1050.141210, 1051.200762,
+        1052.260282, 1053.319771, 1054.379227, 1055.438652, 1056.498046, 1057.557408,
+        1058.616738, 1059.676037, 1060.735304, 1061.794541, 1062.853746, 1063.912919,
+        1064.972062, 1066.031173, 1067.090253, 1068.149302, 1069.208320, 1070.267307,
+        1071.326263, 1072.385189, 1073.444083, 1074.502947, 1075.561780, 1076.620583,
+        1077.679354, 1078.738096, 1079.796806, 1080.855486, 1081.914136, 1082.972756,
+        1084.031345, 1085.089903, 1086.148432, 1087.206930, 1088.265398, 1089.323836,
+        1090.382244, 1091.440622, 1092.498971, 1093.557289, 1094.615577, 1095.673835,
+        1096.732064, 1097.790263, 1098.848432, 1099.906572, 1100.964682, 1102.022762,
+        1103.080813, 1104.138834, 1105.196827, 1106.254789, 1107.312723, 1108.370627,
+        1109.428501, 1110.486347, 1111.544164, 1112.601951, 1113.659709, 1114.717439,
+        1115.775139, 1116.832810, 1117.890453, 1118.948066,
+    ]),
+    0.001: array("d", [
+        10.827566, 13.815511, 16.266236, 18.466827, 20.515006, 22.457744,
+        24.321886, 26.124482, 27.877165, 29.588298, 31.264134, 32.909490,
+        34.528179, 36.123274, 37.697298, 39.252355, 40.790217, 42.312396,
+        43.820196, 45.314747, 46.797038, 48.267942, 49.728232, 51.178598,
+        52.619656, 54.051962, 55.476020, 56.892285, 58.301173, 59.703064,
+        61.098306, 62.487219, 63.870099, 65.247217, 66.618829, 67.985168,
+        69.346452, 70.702887, 72.054663, 73.401958, 74.744938, 76.083763,
+        77.418578, 78.749524, 80.076732, 81.400326, 82.720423, 84.037134,
+        85.350565, 86.660815, 87.967980, 89.272151, 90.573412, 91.871847,
+        93.167533, 94.460545, 95.750954, 97.038829, 98.324234, 99.607233,
+        100.887885, 102.166248, 103.442377, 104.716325, 105.988143, 107.257880,
+        108.525582, 109.791296, 111.055066, 112.316932, 113.576936, 114.835117,
+        116.091513, 117.346161, 118.599095, 119.850350, 121.099959, 122.347954,
+        123.594366, 124.839224, 126.082558, 127.324397, 128.564766, 129.803693,
+        131.041204, 132.277323, 133.512074, 134.745481, 135.977567, 137.208354,
+        138.437864, 139.666117, 140.893134, 142.118935, 143.343540, 144.566966,
+        145.789233, 147.010358, 148.230359, 149.449253, 150.667056, 151.883784,
+        153.099453, 154.314080, 155.527677, 156.740261, 157.951845, 159.162444,
+        160.372071, 161.580740, 162.788463, 163.995253, 165.201123, 166.406085,
+        167.610151, 168.813332, 170.015640, 171.217086, 172.417682, 173.617436,
+        174.816361, 176.014467, 177.211763, 178.408259, 179.603965, 180.798891,
+        181.993045, 183.186437, 184.379076, 185.570970, 186.762129, 187.952559,
+        189.142271, 190.331271, 191.519567, 192.707169, 193.894082, 195.080315,
+        196.265875, 197.450770, 198.635005, 199.818590, 201.001529, 202.183831,
+        203.365501, 204.546546, 205.726973, 206.906787, 208.085996, 209.264605,
+        210.442620, 211.620047, 212.796891, 213.973160, 215.148857, 216.323989,
+        217.498561, 218.672578, 219.846046, 221.018970, 222.191355, 223.363205,
+        224.534526, 225.705324, 226.875601, 228.045364, 229.214616, 230.383363,
+        231.551609, 232.719359, 233.886616, 235.053385, 236.219670, 237.385476,
+        238.550806, 239.715665, 240.880057, 242.043985, 243.207454, 244.370467,
+        245.533029, 246.695142, 247.856811, 249.018039, 250.178830, 251.339187,
+        252.499114, 253.658615, 254.817692, 255.976349, 257.134589, 258.292416,
+        259.449833, 260.606843, 261.763449, 262.919654, 264.075461, 265.230874,
+        266.385895, 267.540528, 268.694774, 269.848638, 271.002122, 272.155228,
+        273.307960, 274.460320, 275.612310, 276.763935, 277.915195, 279.066095,
+        280.216636, 281.366820, 282.516652, 283.666132, 284.815263, 285.964049,
+        287.112490, 288.260590, 289.408352, 290.555776, 291.702866, 292.849624,
+        293.996051, 295.142152, 296.287926, 297.433377, 298.578507, 299.723318,
+        300.867812, 302.011991, 303.155857, 304.299412, 305.442658, 306.585598,
+        307.728232, 308.870564, 310.012594, 311.154326, 312.295760, 313.436899,
+        314.577744, 315.718298, 316.858561, 317.998537, 319.138226, 320.277630,
+        321.416752, 322.555592, 323.694153, 324.832437, 325.970444, 327.108176,
+        328.245636, 329.382825, 330.519744, 331.656395, 332.792779, 333.928899,
+        335.064755, 336.200349, 337.335683, 338.470758, 339.605576, 340.740137,
+        341.874445, 343.008499, 344.142302, 345.275854, 346.409158, 347.542215,
+        348.675025, 349.807591, 350.939913, 352.071993, 353.203833, 354.335433,
+        355.466796, 356.597921, 357.728811, 358.859467, 359.989890, 361.120081,
+        362.250042, 363.379773, 364.509276, 365.638553, 366.767603, 367.896430,
+        369.025033, 370.153413, 371.281573, 372.409513, 373.537234, 374.664737,
+        375.792024, 376.919096, 378.045953, 379.172596, 380.299028, 381.425249,
+        382.551259, 383.677060, 384.802654, 385.928040, 387.053221, 388.178196,
+        389.302968, 390.427536, 391.551903, 392.676069, 393.800035, 394.923801,
+        396.047370, 397.170742, 398.293917, 399.416897, 400.539683, 401.662275,
+        402.784675, 403.906883, 405.028901, 406.150728, 407.272367, 408.393818,
+        409.515082, 410.636159, 411.757051, 412.877758, 413.998281, 415.118622,
+        416.238780, 417.358757, 418.478554, 419.598171, 420.717609, 421.836869,
+        422.955952, 424.074858, 425.193589, 426.312145, 427.430527, 428.548735,
+        429.666771, 430.784634, 431.902327, 433.019850, 434.137202, 435.254386,
+        436.371402, 437.488250, 438.604932, 439.721448, 440.837798, 441.953983,
+        443.070005, 444.185864, 445.301560, 446.417094, 447.532467, 448.647679,
+        449.762732, 450.877625, 451.992360, 453.106938, 454.221358, 455.335621,
+        456.449728, 457.563681, 458.677478, 459.791122, 460.904612, 462.017949,
+        463.131134, 464.244168, 465.357051, 466.469783, 467.582366, 468.694799,
+        469.807084, 470.919221, 472.031211, 473.143053, 474.254750, 475.366301,
+        476.477707, 477.588968, 478.700085, 479.811059, 480.921890, 482.032579,
+        483.143126, 484.253532, 485.363797, 486.473922, 487.583907, 488.693754,
+        489.803461, 490.913031, 492.022463, 493.131759, 494.240918, 495.349940,
+        496.458828, 497.567580, 498.676198, 499.784682, 500.893033, 502.001250,
+        503.109336, 504.217289, 505.325110, 506.432801, 507.540361, 508.647791,
+        509.755091, 510.862263, 511.969305, 513.076219, 514.183006, 515.289665,
+        516.396198, 517.502604, 518.608884, 519.715038, 520.821068, 521.926973,
+        523.032753, 524.138410, 525.243944, 526.349355, 527.454643, 528.559810,
+        529.664854, 530.769778, 531.874581, 532.979263, 534.083826, 535.188269,
+        536.292593, 537.396798, 538.500885, 539.604854, 540.708705, 541.812440,
+        542.916058, 544.019559, 545.122944, 546.226214, 547.329369, 548.432409,
+        549.535335, 550.638147, 551.740845, 552.843430, 553.945902, 555.048261,
+        556.150508, 557.252644, 558.354668, 559.456581, 560.558384, 561.660076,
+        562.761658, 563.863131, 564.964494, 566.065748, 567.166894, 568.267932,
+        569.368862, 570.469684, 571.570400, 572.671008, 573.771510, 574.871906,
+        575.972196, 577.072380, 578.172460, 579.272434, 580.372304, 581.472070,
+        582.571732, 583.671291, 584.770746, 585.870099, 586.969349, 588.068497,
+        589.167543, 590.266487, 591.365330, 592.464072, 593.562713, 594.661254,
+        595.759695, 596.858037, 597.956278, 599.054421, 600.152465, 601.250410,
+        602.348257, 603.446006, 604.543657, 605.641211, 606.738668, 607.836028,
+        608.933292, 610.030459, 611.127531, 612.224506, 613.321387, 614.418172,
+        615.514863, 616.611459, 617.707960, 618.804368, 619.900682, 620.996903,
+        622.093030, 623.189065, 624.285007, 625.380857, 626.476614, 627.572280,
+        628.667854, 629.763337, 630.858729, 631.954030, 633.049241, 634.144361,
+        635.239391, 636.334332, 637.429183, 638.523945, 639.618618, 640.713202,
+        641.807697, 642.902105, 643.996424, 645.090656, 646.184800, 647.278857,
+        648.372827, 649.466710, 650.560506, 651.654217, 652.747841, 653.841379,
+        654.934832, 656.028199, 657.121482, 658.214679, 659.307792, 660.400820,
+        661.493764, 662.586624, 663.679401, 664.772094, 665.864703, 666.957230,
+        668.049674, 669.142035, 670.234313, 671.326510, 672.418625, 673.510657,
+        674.602609, 675.694479, 676.786267, 677.877975, 678.969603, 680.061150,
+        681.152616, 682.244003, 683.335310, 684.426537, 685.517685, 686.608753,
+        687.699743, 688.790654, 689.881486, 690.972240, 692.062915, 693.153513,
+        694.244033, 695.334475, 696.424840, 697.515128, 698.605339, 699.695473,
+        700.785530, 701.875512, 702.965416, 704.055245, 705.144998, 706.234676,
+        707.324278, 708.413804, 709.503256, 710.592633, 711.681935, 712.771163,
+        713.860316, 714.949396, 716.038401, 717.127332, 718.216190, 719.304975,
+        720.393687, 721.482325, 722.570891, 723.659384, 724.747804, 725.836152,
+        726.924428, 728.012632, 729.100764, 730.188825, 731.276814, 732.364732,
+        733.452579, 734.540355, 735.628061, 736.715695, 737.803260, 738.890754,
+        739.978178, 741.065532, 742.152816, 743.240031, 744.327177, 745.414253,
+        746.501260, 747.588199, 748.675068, 749.761869, 750.848602, 751.935266,
+        753.021862, 754.108391, 755.194851, 756.281244, 757.367570, 758.453828,
+        759.540019, 760.626143, 761.712201, 762.798191, 763.884116, 764.969973,
+        766.055765, 767.141490, 768.227150, 769.312744, 770.398272, 771.483735,
+        772.569133, 773.654465, 774.739733, 775.824935, 776.910073, 777.995146,
+        779.080155, 780.165100, 781.249981, 782.334797, 783.419550, 784.504239,
+        785.588865, 786.673427, 787.757926, 788.842361, 789.926734, 791.011044,
+        792.095291, 793.179476, 794.263599, 795.347659, 796.431657, 797.515592,
+        798.599467, 799.683279, 800.767030, 801.850719, 802.934347, 804.017914,
+        805.101420, 806.184865, 807.268249, 808.351572, 809.434835, 810.518038,
+        811.601180, 812.684262, 813.767284, 814.850247, 815.933149, 817.015992,
+        818.098776, 819.181500, 820.264165, 821.346771, 822.429317, 823.511805,
+        824.594235, 825.676606, 826.758918, 827.841172, 828.923367, 830.005505,
+        831.087585, 832.169607, 833.251571, 834.333477, 835.415326, 836.497118,
+        837.578852, 838.660529, 839.742150, 840.823713, 841.905220, 842.986670,
+        844.068063, 845.149400, 846.230681, 847.311906, 848.393074, 849.474187,
+        850.555244, 851.636245, 852.717190, 853.798080, 854.878915, 855.959694,
+        857.040418, 858.121087, 859.201702, 860.282261, 861.362766, 862.443216,
+        863.523612, 864.603953, 865.684240, 866.764473, 867.844652, 868.924777,
+        870.004848, 871.084866, 872.164829, 873.244740, 874.324597, 875.404400,
+        876.484151, 877.563848, 878.643493, 879.723085, 880.802624, 881.882110,
+        882.961544, 884.040925, 885.120254, 886.199531, 887.278755, 888.357928,
+        889.437049, 890.516117, 891.595135, 892.674100, 893.753014, 894.831877,
+        895.910688, 896.989448, 898.068157, 899.146815, 900.225422, 901.303978,
+        902.382484, 903.460939, 904.539343, 905.617697, 906.696001, 907.774254,
+        908.852457, 909.930611, 911.008714, 912.086767, 913.164771, 914.242725,
+        915.320630, 916.398485, 917.476290, 918.554047, 919.631754, 920.709412,
+        921.787021, 922.864581, 923.942092, 925.019555, 926.096969, 927.174335,
+        928.251652, 929.328920, 930.406141, 931.483313, 932.560437, 933.637513,
+        934.714542, 935.791522, 936.868455, 937.945340, 939.022177, 940.098967,
+        941.175710, 942.252405, 943.329054, 944.405655, 945.482209, 946.558716,
+        947.635176, 948.711590, 949.787956, 950.864277, 951.940550, 953.016778,
+        954.092959, 955.169093, 956.245182, 957.321224, 958.397221, 959.473171,
+        960.549076, 961.624935, 962.700748, 963.776516, 964.852238, 965.927914,
+        967.003546, 968.079132, 969.154673, 970.230169, 971.305619, 972.381025,
+        973.456386, 974.531703, 975.606974, 976.682201, 977.757383, 978.832521,
+        979.907615, 980.982664, 982.057669, 983.132630, 984.207547, 985.282419,
+        986.357248, 987.432033, 988.506774, 989.581472, 990.656126, 991.730736,
+        992.805303, 993.879827, 994.954307, 996.028744, 997.103138, 998.177489,
+        999.251797, 1000.326062, 1001.400284, 1002.474463, 1003.548600, 1004.622693,
+        1005.696745, 1006.770754, 1007.844720, 1008.918644, 1009.992526, 1011.066366,
+        1012.140163, 1013.213919, 1014.287632, 1015.361304, 1016.434934, 1017.508522,
+        1018.582068, 1019.655572, 1020.729036, 1021.802457, 1022.875837, 1023.949176,
+        1025.022474, 1026.095730, 1027.168946, 1028.242120, 1029.315253, 1030.388345,
+        1031.461397, 1032.534407, 1033.607377, 1034.680306, 1035.753195, 1036.826043,
+        1037.898851, 1038.971618, 1040.044345, 1041.117032, 1042.189679, 1043.262285,
+        1044.334851, 1045.407378, 1046.479864, 1047.552311, 1048.624718, 1049.697085,
+        1050.769413, 1051.841700, 1052.913949, 1053.986158, 1055.058327, 1056.130457,
+        1057.202548, 1058.274600, 1059.346613, 1060.418586, 1061.490521, 1062.562416,
+        1063.634273, 1064.706091, 1065.777870, 1066.849610, 1067.921312, 1068.992975,
+        1070.064600, 1071.136186, 1072.207734, 1073.279243, 1074.350715, 1075.422148,
+        1076.493543, 1077.564899, 1078.636218, 1079.707499, 1080.778742, 1081.849947,
+        1082.921115, 1083.992244, 1085.063336, 1086.134390, 1087.205407, 1088.276387,
+        1089.347329, 1090.418233, 1091.489101, 1092.559931, 1093.630723, 1094.701479,
+        1095.772198, 1096.842880, 1097.913524, 1098.984132, 1100.054703, 1101.125237,
+        1102.195735, 1103.266196, 1104.336620, 1105.407008, 1106.477359, 1107.547674,
+        1108.617952, 1109.688194, 1110.758400, 1111.828569, 1112.898703, 1113.968800,
+        1115.038861, 1116.108887, 1117.178876, 1118.248830, 1119.318747, 1120.388629,
+        1121.458475, 1122.528286, 1123.598061, 1124.667800, 1125.737504, 1126.807173,
+        1127.876806, 1128.946404, 1130.015966, 1131.085493, 1132.154986, 1133.224443,
+        1134.293864, 1135.363251, 1136.432603, 1137.501920, 1138.571203, 1139.640450,
+        1140.709663, 1141.778841, 1142.847984, 1143.917093,
+    ]),
+}
+# fmt: on
@@ -28,7 +28,7 @@ from typing import cast
 import warnings
 
 
-def gamma(s: Fraction | int, z: Fraction | int) -> Fraction:
+def gamma(s: Fraction | int, z: Fraction | int, ε: float = 1e-8) -> Fraction:
     def terms(s: Fraction | int, z: Fraction | int) -> Iterator[Fraction]:
         """Terms for computing partial gamma"""
         for k in range(100):
@@ -46,7 +46,6 @@ def gamma(s: Fraction | int, z: Fraction | int) -> Fraction:
                 return
             yield v
 
-    ε = 1e-8
     insignificant: Callable[[Fraction], bool] = lambda t: abs(t) < ε
     g = sum(take_until(insignificant, terms(s, z)))
     # cast() from Union[Fraction, int] to Fraction
@@ -118,15 +117,16 @@ Fraction(291270, 328663)
 """
 
 
-def cdf(x: Union[Fraction, float], k: int) -> Fraction:
+def cdf(x: Union[Fraction, float], k: int, ε: float = 1e-8) -> Fraction:
     """X² cumulative distribution function.
 
     :param x: X² value, sum (obs[i]-exp[i])**2/exp[i]}
         for parallel sequences of observed and expected values.
     :param k: degrees of freedom >= 1; often len(data)-1
+    :param ε: the smallest term of the gamma series to include
     """
 
-    return 1 - gamma(Fraction(k, 2), Fraction(x / 2)) / Gamma_Half(Fraction(k, 2))
+    return 1 - gamma(Fraction(k, 2), Fraction(x / 2), ε) / Gamma_Half(Fraction(k, 2))
 
 
 def test_cdf() -> None:
@@ -160,4 +160,248 @@ def test_cdf() -> None:
     assert cdf(9.488, 4).limit_denominator(1000) == Fraction(1, 20)
 
 
+import math
+
+
+def gamma_series(s: float, z: float) -> float:
+    """
+    Regularized lower incomplete gamma, P(s, z) = γ(s, z)/Γ(s),
+    by its power series. This converges quickly for z < s + 1.
+    The common factor, z**s * exp(-z) / Γ(s), is computed in log space,
+    so large arguments neither overflow nor underflow.
+    """
+    if z <= 0:
+        return 0.0
+    term = total = 1.0 / s
+    a = s
+    for _ in range(1_000):
+        a += 1
+        term *= z / a
+        total += term
+        if abs(term) < abs(total) * 1e-16:
+            break
+    else:
+        warnings.warn("gamma_series did not converge")
+    return total * math.exp(s * math.log(z) - z - math.lgamma(s))
+
+
+def gamma_continued_fraction(s: float, z: float) -> float:
+    """
+    Regularized upper incomplete gamma, Q(s, z) = 1 - P(s, z),
+    by its continued fraction, evaluated with the modified Lentz algorithm.
+    This converges quickly for z >= s + 1.
+    """
+    tiny = 1e-300
+    b = z + 1 - s
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 1_000):
+        a = -i * (i - s)
+        b += 2
+        d = a * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + a / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-16:
+            break
+    else:
+        warnings.warn("gamma_continued_fraction did not converge")
+    return h * math.exp(s * math.log(z) - z - math.lgamma(s))
+
+
+def cdf_float(x: float, k: int) -> float:
+    """X² cumulative distribution function, using floats.
+
+    The same value as :func:`cdf`, 1 - γ(k/2, x/2)/Γ(k/2),
+    which is Q(k/2, x/2). Whichever of the series and continued fraction
+    converges faster is used.
+
+    >>> round(cdf_float(19.18, 6), 5)
+    0.00387
+    >>> cdf_float(1_000, 6)  # doctest: +ELLIPSIS
+    8.94...e-213
+    """
+    s, z = k / 2, x / 2
+    if z < s + 1:
+        return 1 - gamma_series(s, z)
+    return gamma_continued_fraction(s, z)
+
+
+def test_cdf_float() -> None:
+    """
+    The Fraction version of :func:`cdf`, summing more terms, is the oracle.
+    For odd k, ``z ** (s + k)`` is a float, and the alternating series
+    loses precision as x grows, so the odd k cases stop at smaller x.
+    """
+    chi2 = [0.004, 0.5, 1.07, 2.71, 3.94, 9.488, 12.131, 19.18, 29.59]
+    for k in (2, 4, 6, 10, 20):
+        for x in chi2:
+            oracle = float(cdf(x, k, ε=1e-15))
+            assert cdf_float(x, k) == approx(oracle, rel=0, abs=1e-10)
+    for k in (1, 3, 5, 7):
+        for x in chi2[:-1]:
+            oracle = float(cdf(x, k, ε=1e-15))
+            assert cdf_float(x, k) == approx(oracle, rel=0, abs=1e-10)
+
+    assert cdf_float(0, 3) == 1.0
+    assert cdf_float(1_000, 1) == approx(math.erfc(math.sqrt(500)))
+    # For k=6, Q(3, z) = exp(-z) * (1 + z + z**2 / 2)
+    assert cdf_float(1_400, 6) == approx(math.exp(-700) * (1 + 700 + 700**2 / 2))
+
+
+def performance() -> None:
+    """P-values per second for the Fraction and float implementations."""
+    import time
+
+    x2 = [x / 10 for x in range(1, 300)]
+    for name, function in ("Fraction", cdf), ("float", cdf_float):
+        start = time.perf_counter()
+        for k in (1, 4, 6, 10):
+            for x in x2:
+                function(x, k)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>8s} {4 * len(x2) / elapsed:12,.0f} p-values/sec")
+
+
+from bisect import bisect
+from pathlib import Path
+
+
+def critical_value(alpha: float, k: int) -> float:
+    """
+    The χ² value, x, where cdf_float(x, k) == alpha, found by bisection.
+
+    >>> round(critical_value(0.05, 6), 4)
+    12.5916
+    """
+    low, high = 0.0, float(k)
+    while cdf_float(high, k) > alpha:
+        low, high = high, 2 * high
+    for _ in range(200):
+        middle = (low + high) / 2
+        if middle in (low, high):
+            break
+        if cdf_float(middle, k) > alpha:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+CRITICAL_ALPHAS = (0.10, 0.05, 0.025, 0.01, 0.005, 0.001)
+CRITICAL_K_MAX = 1000
+
+
+def write_critical_values(
+    target: Path = Path(__file__).parent / "ch16_critical.py",
+) -> None:
+    """
+    Writes the critical value table module, ``ch16_critical.py``.
+    Each α has an array of critical values for k from 1 to CRITICAL_K_MAX.
+    """
+    lines = [
+        '"""Functional Python Programming 3e',
+        "",
+        "Chapter 16, χ² critical values",
+        "",
+        "Generated by ch16_ex3.write_critical_values(). Do not edit.",
+        '"""',
+        "",
+        "from array import array",
+        "",
+        f"ALPHAS = {CRITICAL_ALPHAS!r}",
+        f"K_MAX = {CRITICAL_K_MAX}",
+        "",
+        "# fmt: off",
+        "CRITICAL_VALUES = {",
+    ]
+    for alpha in CRITICAL_ALPHAS:
+        values = [
+            f"{critical_value(alpha, k):.6f}" for k in range(1, CRITICAL_K_MAX + 1)
+        ]
+        lines.append(f'    {alpha!r}: array("d", [')
+        for start in range(0, len(values), 6):
+            lines.append("        " + ", ".join(values[start : start + 6]) + ",")
+        lines.append("    ]),")
+    lines.extend(["}", "# fmt: on"])
+    target.write_text("\n".join(lines) + "\n")
+
+
+from Chapter16.ch16_critical import ALPHAS, K_MAX, CRITICAL_VALUES
+
+
+def is_significant(chi2: float, k: int, alpha: float = 0.05) -> bool:
+    """
+    Is χ² beyond the critical value at α for k degrees of freedom?
+    This uses the precomputed table. An α between two of the table's levels
+    is interpolated, linearly in log α. Anything else falls back to
+    :func:`cdf_float`.
+
+    >>> is_significant(19.18, 6), is_significant(19.18, 6, alpha=0.001)
+    (True, False)
+    >>> is_significant(12.5, 6, alpha=0.06)
+    True
+    """
+    if 1 <= k <= K_MAX:
+        if alpha in CRITICAL_VALUES:
+            return chi2 > CRITICAL_VALUES[alpha][k - 1]
+        levels = ALPHAS[::-1]
+        i = bisect(levels, alpha)
+        if 0 < i < len(levels):
+            a_0, a_1 = levels[i - 1], levels[i]
+            c_0, c_1 = CRITICAL_VALUES[a_0][k - 1], CRITICAL_VALUES[a_1][k - 1]
+            w = math.log(alpha / a_0) / math.log(a_1 / a_0)
+            return chi2 > c_0 + w * (c_1 - c_0)
+    return cdf_float(chi2, k) < alpha
+
+
+def test_critical_values() -> None:
+    assert ALPHAS == CRITICAL_ALPHAS and K_MAX == CRITICAL_K_MAX
+    # The exact Fraction cdf() at a sample of the tabulated values.
+    for alpha in ALPHAS:
+        for k in (2, 4, 6, 10):
+            x = CRITICAL_VALUES[alpha][k - 1]
+            assert float(cdf(x, k, ε=1e-15)) == approx(alpha, rel=1e-5)
+    for alpha in ALPHAS:
+        for k in (1, 17, 250, 999, 1000):
+            x = CRITICAL_VALUES[alpha][k - 1]
+            assert cdf_float(x, k) == approx(alpha, rel=1e-5)
+
+    # NIST handbook values.
+    assert CRITICAL_VALUES[0.05][5] == approx(12.5916, abs=5e-5)
+    assert CRITICAL_VALUES[0.05][3] == approx(9.4877, abs=5e-5)
+
+    # Table lookups agree with the cdf away from the critical value.
+    for alpha in (0.1, 0.07, 0.05, 0.02, 0.002, 0.001, 0.0001):
+        for k in (1, 6, 50, 1000, 1200):
+            x = critical_value(alpha, k)
+            assert is_significant(x * 1.01, k, alpha)
+            assert not is_significant(x * 0.99, k, alpha)
+
+
+def performance_is_significant() -> None:
+    """Tests per second using the table and using the cdf."""
+    import time
+
+    x2 = [x / 10 for x in range(1, 300)]
+    for name, test in (
+        ("cdf_float", lambda x, k: cdf_float(x, k) < 0.05),
+        ("table", is_significant),
+    ):
+        start = time.perf_counter()
+        for k in (1, 4, 6, 10):
+            for x in x2:
+                test(x, k)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>10s} {4 * len(x2) / elapsed:12,.0f} tests/sec")
+
+
 __test__ = {name: value for name, value in globals().items() if name.startswith("REPL")}
+
+if __name__ == "__main__":
+    performance()
+    performance_is_significant()
@@ -5,8 +5,10 @@ Chapter 16, Sample Data Generator
 """
 import csv
 import random
-from itertools import cycle, islice
-from typing import List, Tuple, Optional
+from concurrent import futures
+from itertools import accumulate, cycle, islice, repeat
+from pathlib import Path
+from typing import Iterator, List, Tuple, Optional
 
 seed = [
     ('1', 'A', 15),
@@ -23,27 +25,31 @@ seed = [
     ('3', 'D', 20),
 ]
 
-def create_data(seed: List[Tuple[str, str, int]]) -> None:
+def create_data(
+    seed: List[Tuple[str, str, int]],
+    rows: int = 1000,
+    filename: str = "qa_data.csv"
+) -> None:
+    """The seed counts are per 1000 rows; they're scaled to ``rows``."""
     Data = Tuple[str, Optional[str]]
 
     raw_defects: List[Data] = [
         (shift, defect)
-        for shift, defect, count in seed for x in range(count)
+        for shift, defect, count in seed for x in range(count * rows // 1000)
     ]
 
     # Should be `set(shift for shift, defect, count in seed)`
-    # Also 1000-309 is based on 1000-sum(count for shift, defect, count in seed)
     shifts = ['1', '2', '3']
     non_defects: List[Data] = [
         (shift, None)
-        for shift in islice(cycle(shifts), 1000-309)
+        for shift in islice(cycle(shifts), rows - len(raw_defects))
     ]
 
     data = raw_defects + non_defects
 
     random.shuffle(data)
 
-    with open("qa_data.csv", 'w', newline='') as output:
+    with open(filename, 'w', newline='') as output:
         wtr = csv.writer(output)
         wtr.writerow(["shift", "defect_type", "serial_number"])
         wtr.writerows(
@@ -51,6 +57,123 @@ def create_data(seed: List[Tuple[str, str, int]]) -> None:
             for serial, s_d in enumerate(data, start=12345)
         )
 
+Row = Tuple[str, Optional[str]]
+
+
+def seed_weights(
+    seed: List[Tuple[str, str, int]], per: int = 1000
+) -> List[Tuple[Row, float]]:
+    """
+    The seed counts as weights of (shift, defect) rows. The rest of every
+    ``per`` rows are non-defects, shared evenly among the shifts.
+    """
+    shifts = sorted(set(shift for shift, defect, count in seed))
+    non_defects = (per - sum(count for shift, defect, count in seed)) / len(shifts)
+    return (
+        [((shift, defect), float(count)) for shift, defect, count in seed]
+        + [((shift, None), non_defects) for shift in shifts]
+    )
+
+
+def stream_rows(
+    rows: int,
+    weights: List[Tuple[Row, float]],
+    rng: random.Random,
+    chunk_size: int = 100_000,
+) -> Iterator[List[Row]]:
+    """Chunks of randomly chosen rows, drawn with the given weights."""
+    population = [row for row, weight in weights]
+    cum_weights = list(accumulate(weight for row, weight in weights))
+    for start in range(0, rows, chunk_size):
+        k = min(chunk_size, rows - start)
+        yield rng.choices(population, cum_weights=cum_weights, k=k)
+
+
+def write_rows(
+    filename: str,
+    rows: int,
+    weights: List[Tuple[Row, float]],
+    rng: random.Random,
+    first_serial: int = 12345,
+    chunk_size: int = 100_000,
+) -> None:
+    """
+    Writes a CSV file, a chunk at a time: each chunk of rows is formatted
+    into one string, and written with a single call to a large buffer.
+    Only one chunk is in memory at a time.
+    """
+    serial = first_serial
+    with open(filename, 'w', newline='', buffering=2**22) as output:
+        output.write("shift,defect_type,serial_number\r\n")
+        for chunk in stream_rows(rows, weights, rng, chunk_size):
+            output.write(
+                ''.join(
+                    f"{shift},{defect or ''},{number}\r\n"
+                    for (shift, defect), number in zip(
+                        chunk, range(serial, serial + len(chunk))
+                    )
+                )
+            )
+            serial += len(chunk)
+
+
+def stream_data(
+    rows: int,
+    filename: str = "qa_data.csv",
+    weights: Optional[List[Tuple[Row, float]]] = None,
+    random_seed: int = 42,
+) -> None:
+    """
+    Streams ``rows`` random rows to a file. Unlike :func:`create_data`,
+    the defect counts are only proportional to the weights, not exact.
+    """
+    weights = weights or seed_weights(seed)
+    write_rows(filename, rows, weights, random.Random(random_seed))
+
+
+def write_shard(
+    filename: str,
+    rows: int,
+    weights: List[Tuple[Row, float]],
+    shard_seed: str,
+    first_serial: int,
+) -> str:
+    write_rows(filename, rows, weights, random.Random(shard_seed), first_serial)
+    return filename
+
+
+def stream_shards(
+    rows: int,
+    shards: int,
+    directory: Optional[Path] = None,
+    weights: Optional[List[Tuple[Row, float]]] = None,
+    random_seed: int = 42,
+    workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Writes ``rows`` random rows as ``shards`` CSV files, in parallel.
+    Each shard has its own RNG, seeded from ``random_seed`` and the shard
+    number, so the output doesn't depend on the number of workers.
+    Serial numbers are unique across the shards.
+    """
+    directory = directory or Path.cwd()
+    weights = weights or seed_weights(seed)
+    sizes = [rows // shards + (i < rows % shards) for i in range(shards)]
+    firsts = list(accumulate(sizes, initial=12345))
+    filenames = [str(directory / f"qa_data_{i:04d}.csv") for i in range(shards)]
+    with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                write_shard,
+                filenames,
+                sizes,
+                repeat(weights),
+                (f"{random_seed}:{i}" for i in range(shards)),
+                firsts,
+            )
+        )
+
+
 def verify_data(seed: List[Tuple[str, str, int]]) -> None:
     from collections import Counter
     with open("qa_data.csv", newline="") as input_file:
@@ -64,6 +187,39 @@ def verify_data(seed: List[Tuple[str, str, int]]) -> None:
     expected = Counter({(s, d): c for s, d, c in seed})
     assert tally == expected
 
+REPL_stream_data = """
+>>> import csv, tempfile
+>>> from collections import Counter
+>>> from pathlib import Path
+>>> directory = Path(tempfile.mkdtemp())
+
+>>> stream_data(30_000, str(directory / "qa.csv"), random_seed=1)
+>>> with open(directory / "qa.csv", newline="") as source:
+...     rows = list(csv.DictReader(source))
+>>> len(rows)
+30000
+>>> rows[0]["serial_number"], rows[-1]["serial_number"]
+('12345', '42344')
+>>> defects = Counter(row["defect_type"] for row in rows if row["defect_type"])
+>>> round(sum(defects.values()) / len(rows), 2)
+0.31
+
+>>> one = stream_shards(1_001, 3, directory, workers=1)
+>>> [Path(name).name for name in one]
+['qa_data_0000.csv', 'qa_data_0001.csv', 'qa_data_0002.csv']
+>>> first = [Path(name).read_text() for name in one]
+>>> two = stream_shards(1_001, 3, directory, workers=2)
+>>> [Path(name).read_text() for name in two] == first
+True
+>>> [len(text.splitlines()) - 1 for text in first]
+[334, 334, 333]
+
+>>> import shutil
+>>> shutil.rmtree(directory)
+"""
+
+__test__ = {name: value for name, value in globals().items() if name.startswith("REPL")}
+
 if __name__ == "__main__":
     #create_data(seed)
     verify_data(seed)